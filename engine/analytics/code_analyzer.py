@@ -12,10 +12,11 @@ Provides real code analysis using AST parsing:
 """
 
 import ast
+import hashlib
 import os
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 from collections import defaultdict
@@ -97,42 +98,30 @@ class ComplexityVisitor(ast.NodeVisitor):
         self.nested_depth = 0
         self.max_nested_depth = 0
 
-    def visit_If(self, node):
-        self.complexity += 1
-        self._enter_nested()
-        self.generic_visit(node)
-        self._exit_nested()
-
-    def visit_For(self, node):
-        self.complexity += 1
-        self._enter_nested()
-        self.generic_visit(node)
-        self._exit_nested()
-
-    def visit_While(self, node):
-        self.complexity += 1
-        self._enter_nested()
-        self.generic_visit(node)
-        self._exit_nested()
-
-    def visit_ExceptHandler(self, node):
-        self.complexity += 1
-        self.generic_visit(node)
-
-    def visit_With(self, node):
-        self.complexity += 1
-        self._enter_nested()
-        self.generic_visit(node)
-        self._exit_nested()
-
-    def visit_BoolOp(self, node):
-        # Each 'and'/'or' adds to complexity
-        self.complexity += len(node.values) - 1
+    # Decision points; the first set also opens a nesting level
+    _NESTING_TYPES = frozenset({ast.If, ast.For, ast.While, ast.With})
+    _BRANCH_TYPES = frozenset({ast.ExceptHandler, ast.comprehension})
+
+    def visit(self, node):
+        # Dispatch on the exact node type with set lookups instead of
+        # NodeVisitor's per-node getattr of a visit_<Name> method
+        node_type = type(node)
+        if node_type in self._NESTING_TYPES:
+            self.complexity += 1
+            self._enter_nested()
+            self.generic_visit(node)
+            self._exit_nested()
+            return
+        if node_type is ast.BoolOp:
+            # Each 'and'/'or' adds to complexity
+            self.complexity += len(node.values) - 1
+        else:
+            self.complexity += node_type in self._BRANCH_TYPES
         self.generic_visit(node)
 
-    def visit_comprehension(self, node):
-        self.complexity += 1
-        self.generic_visit(node)
+    def generic_visit(self, node):
+        for child in ast.iter_child_nodes(node):
+            self.visit(child)
 
     def _enter_nested(self):
         self.nested_depth += 1
@@ -172,15 +161,28 @@ class SecurityAnalyzer:
         (r'token\s*=\s*["\'][A-Za-z0-9]{20,}["\']', 'Possible hardcoded token'),
     ]
 
+    # Patterns are compiled once; the combined alternation lets lines that
+    # match no rule at all be skipped with a single regex search.
+    _DANGEROUS = [(re.compile(p, re.IGNORECASE), m) for p, m in DANGEROUS_PATTERNS]
+    _SQL = [(re.compile(p, re.IGNORECASE), m) for p, m in SQL_PATTERNS]
+    _SECRETS = [(re.compile(p, re.IGNORECASE), m) for p, m in SECRET_PATTERNS]
+    _ANY = re.compile(
+        '|'.join(f'(?:{p})' for p, _ in DANGEROUS_PATTERNS + SQL_PATTERNS + SECRET_PATTERNS),
+        re.IGNORECASE
+    )
+
     def analyze(self, code: str, file_path: str) -> List[CodeIssue]:
         """Analyze code for security issues."""
         issues = []
         lines = code.split('\n')
 
         for line_num, line in enumerate(lines, 1):
+            if not self._ANY.search(line):
+                continue
+
             # Check dangerous patterns
-            for pattern, message in self.DANGEROUS_PATTERNS:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern, message in self._DANGEROUS:
+                if pattern.search(line):
                     issues.append(CodeIssue(
                         severity='critical',
                         category='security',
@@ -192,8 +194,8 @@ class SecurityAnalyzer:
                     ))
 
             # Check SQL patterns
-            for pattern, message in self.SQL_PATTERNS:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern, message in self._SQL:
+                if pattern.search(line):
                     issues.append(CodeIssue(
                         severity='critical',
                         category='security',
@@ -205,8 +207,8 @@ class SecurityAnalyzer:
                     ))
 
             # Check secret patterns
-            for pattern, message in self.SECRET_PATTERNS:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern, message in self._SECRETS:
+                if pattern.search(line):
                     issues.append(CodeIssue(
                         severity='warning',
                         category='security',
@@ -272,12 +274,74 @@ class CodeAnalyzer:
     Main code analyzer combining all analysis capabilities.
     """
 
-    def __init__(self):
+    # Bump when the cached result layout changes
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[str] = None):
         self.security_analyzer = SecurityAnalyzer()
         self.style_analyzer = StyleAnalyzer()
+        # Per-file results keyed on path, mtime and size; None disables caching
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
     def analyze_file(self, file_path: str) -> Tuple[FileMetrics, List[CodeIssue]]:
         """Analyze a single Python file."""
+        cache_path = self._cache_path(file_path)
+        if cache_path is not None:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return cached
+
+        metrics, issues = self._analyze_source(file_path)
+
+        if cache_path is not None:
+            self._store_cached(cache_path, metrics, issues)
+        return metrics, issues
+
+    def _cache_path(self, file_path: str) -> Optional[Path]:
+        """Cache file for the current contents of file_path, if caching."""
+        if self.cache_dir is None:
+            return None
+        stat = os.stat(file_path)
+        key = (f"{self.CACHE_VERSION}:{os.path.abspath(file_path)}:{file_path}:"
+               f"{stat.st_mtime_ns}:{stat.st_size}")
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _load_cached(cache_path: Path) -> Optional[Tuple[FileMetrics, List[CodeIssue]]]:
+        """Rebuild cached results; None on a miss or unreadable entry."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Entries from an older layout or a damaged file count as misses
+        try:
+            metrics = data['metrics']
+            metrics['functions'] = [FunctionMetrics(**m) for m in metrics['functions']]
+            metrics['classes'] = [
+                ClassMetrics(**{**c, 'methods': [FunctionMetrics(**m) for m in c['methods']]})
+                for c in metrics['classes']
+            ]
+            return FileMetrics(**metrics), [CodeIssue(**i) for i in data['issues']]
+        except (KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _store_cached(cache_path: Path, metrics: FileMetrics, issues: List[CodeIssue]) -> None:
+        """Write results as JSON; the cache is best effort."""
+        data = {'metrics': asdict(metrics), 'issues': [asdict(i) for i in issues]}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def _analyze_source(self, file_path: str) -> Tuple[FileMetrics, List[CodeIssue]]:
+        """Read and analyze file_path without consulting the cache."""
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             code = f.read()
 
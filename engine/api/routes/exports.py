@@ -280,7 +280,7 @@ def export_3d():
             properties:
               format:
                 type: string
-                enum: [obj, stl, gltf]
+                enum: [obj, stl, gltf, glb]
     responses:
       200:
         description: 3D model generated
@@ -312,7 +312,7 @@ def export_3d():
         format_type = data.get('format', 'obj').lower()
         options = data.get('options', {})
 
-        if format_type not in ['obj', 'stl', 'gltf']:
+        if format_type not in ['obj', 'stl', 'gltf', 'glb']:
             return jsonify({
                 "success": False,
                 "data": None,
@@ -344,7 +344,8 @@ def export_3d():
             panels_y=layout.panels_per_row,
             panel_width_mm=layout.panel_width_mm,
             panel_height_mm=layout.panel_length_mm,
-            include_frame=options.get('include_frame', True)
+            include_frame=options.get('include_frame', True),
+            cull_hidden_faces=options.get('cull_hidden_faces', False)
         )
 
         # Export to file
@@ -358,6 +359,8 @@ def export_3d():
             MeshExporter.to_stl(mesh, filepath)
         elif format_type == 'gltf':
             MeshExporter.to_gltf(mesh, filepath)
+        elif format_type == 'glb':
+            MeshExporter.to_glb(mesh, filepath, quantize=options.get('quantize', False))
 
         # Get file size
         file_size = os.path.getsize(filepath)
@@ -45,6 +45,13 @@ class Transaction:
     signature: str
     fee: float = 0.0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form used for block and merkle hashing"""
+        data = asdict(self)
+        data['block_type'] = self.block_type.value
+        data['timestamp'] = self.timestamp.isoformat()
+        return data
+
 
 @dataclass
 class Block:
@@ -108,9 +115,14 @@ class Blockchain:
     def calculate_hash(self, block_number: int, previous_hash: str, 
                       transactions: List[Transaction], nonce: int) -> str:
         """Calculate block hash"""
+        block_data = self._block_prefix(block_number, previous_hash, transactions)
+        return hashlib.sha256(block_data + str(nonce).encode()).hexdigest()
+    
+    def _block_prefix(self, block_number: int, previous_hash: str,
+                      transactions: List[Transaction]) -> bytes:
+        """Hashed block data that precedes the nonce"""
         transaction_data = json.dumps([t.to_dict() for t in transactions], sort_keys=True)
-        block_data = f"{block_number}{previous_hash}{transaction_data}{nonce}"
-        return hashlib.sha256(block_data.encode()).hexdigest()
+        return f"{block_number}{previous_hash}{transaction_data}".encode()
     
     def get_last_block(self) -> Block:
         """Get the last block in the chain"""
@@ -142,21 +154,27 @@ class Blockchain:
         # Calculate merkle root (simplified)
         merkle_root = self.calculate_merkle_root(self.pending_transactions)
         
-        # Proof of work
+        # Proof of work: hash the block data once and extend a copy of that
+        # SHA-256 state with each nonce; a hex digest starting with
+        # `difficulty` zeros has its top 4 * difficulty bits clear
+        prefix = hashlib.sha256(self._block_prefix(
+            new_block_number,
+            last_block.hash,
+            self.pending_transactions
+        ))
+        shift = 256 - 4 * self.difficulty
         nonce = 0
-        hash_attempt = ""
-        target = "0" * self.difficulty
         
         print(f"⛏️  Mining block {new_block_number}...")
         
-        while not hash_attempt.startswith(target):
+        while True:
             nonce += 1
-            hash_attempt = self.calculate_hash(
-                new_block_number,
-                last_block.hash,
-                self.pending_transactions,
-                nonce
-            )
+            attempt = prefix.copy()
+            attempt.update(str(nonce).encode())
+            digest = attempt.digest()
+            if int.from_bytes(digest, "big") >> shift == 0:
+                break
+        hash_attempt = digest.hex()
         
         # Create new block
         new_block = Block(
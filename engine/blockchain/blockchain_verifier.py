@@ -98,24 +98,46 @@ class Block:
     nonce: int = 0
     hash: str = ""
 
-    def compute_hash(self) -> str:
-        """Compute block hash including nonce (for proof of work)."""
+    def _hash_parts(self) -> Tuple[bytes, bytes]:
+        """Split the block's JSON encoding around the nonce value."""
         data = {
             'index': self.index,
             'timestamp': self.timestamp,
             'transactions': [t.compute_hash() for t in self.transactions],
             'previous_hash': self.previous_hash,
-            'nonce': self.nonce
+            'nonce': 0
         }
         data_str = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()
+        # Only ints, floats and hex digests are encoded, so the key is unique
+        split = data_str.index('"nonce": ') + len('"nonce": ')
+        return data_str[:split].encode(), data_str[split + 1:].encode()
+
+    def compute_hash(self) -> str:
+        """Compute block hash including nonce (for proof of work)."""
+        head, tail = self._hash_parts()
+        return hashlib.sha256(head + str(self.nonce).encode() + tail).hexdigest()
 
     def mine(self, difficulty: int = 4) -> None:
         """Mine block with proof of work."""
-        target = '0' * difficulty
-        while not self.hash.startswith(target):
-            self.nonce += 1
-            self.hash = self.compute_hash()
+        if self.hash.startswith('0' * difficulty):
+            return
+
+        # Everything before the nonce is hashed once; each attempt resumes
+        # from a copy of that state
+        head, tail = self._hash_parts()
+        prefix = hashlib.sha256(head)
+        # difficulty leading hex zeros == top 4 * difficulty bits clear
+        shift = 256 - 4 * difficulty
+        nonce = self.nonce
+        while True:
+            nonce += 1
+            candidate = prefix.copy()
+            candidate.update(str(nonce).encode() + tail)
+            if int.from_bytes(candidate.digest(), 'big') >> shift == 0:
+                break
+
+        self.nonce = nonce
+        self.hash = candidate.hexdigest()
 
 
 class MerkleTree:
@@ -323,22 +345,36 @@ class MaterialBlockchain:
 
     def verify_certificate(self, material_id: str) -> Dict[str, Any]:
         """Verify a material certificate's authenticity."""
-        if material_id not in self.certificates:
-            return {
-                'valid': False,
-                'error': 'Certificate not found',
-                'material_id': material_id
-            }
+        return self.verify_certificates([material_id])[material_id]
+
+    def verify_certificates(self, material_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Verify several material certificates in one pass.
+
+        The chain is walked and integrity-checked once for the whole batch
+        instead of once per material.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        transactions: Dict[str, List[Dict[str, Any]]] = {}
+
+        for material_id in material_ids:
+            if material_id not in self.certificates:
+                results[material_id] = {
+                    'valid': False,
+                    'error': 'Certificate not found',
+                    'material_id': material_id
+                }
+            else:
+                transactions[material_id] = []
 
-        cert = self.certificates[material_id]
-        cert_hash = cert.compute_hash()
+        if not transactions:
+            return results
 
-        # Find all transactions for this material
-        transactions = []
+        # Find all transactions for the requested materials
         for block in self.chain:
             for tx in block.transactions:
-                if tx.material_id == material_id:
-                    transactions.append({
+                if tx.material_id in transactions:
+                    transactions[tx.material_id].append({
                         'tx_id': tx.tx_id,
                         'type': tx.transaction_type,
                         'timestamp': datetime.fromtimestamp(tx.timestamp).isoformat(),
@@ -348,18 +384,24 @@ class MaterialBlockchain:
                         'unit': tx.unit
                     })
 
-        return {
-            'valid': True,
-            'material_id': material_id,
-            'certificate_hash': cert_hash,
-            'certifications': cert.certifications,
-            'manufacturer': cert.manufacturer,
-            'batch_number': cert.batch_number,
-            'production_date': cert.production_date,
-            'transaction_count': len(transactions),
-            'transactions': transactions,
-            'blockchain_verified': self.verify_chain()
-        }
+        chain_valid = self.verify_chain()
+
+        for material_id, material_txs in transactions.items():
+            cert = self.certificates[material_id]
+            results[material_id] = {
+                'valid': True,
+                'material_id': material_id,
+                'certificate_hash': cert.compute_hash(),
+                'certifications': cert.certifications,
+                'manufacturer': cert.manufacturer,
+                'batch_number': cert.batch_number,
+                'production_date': cert.production_date,
+                'transaction_count': len(material_txs),
+                'transactions': material_txs,
+                'blockchain_verified': chain_valid
+            }
+
+        return results
 
     def verify_chain(self) -> bool:
         """Verify the entire blockchain integrity."""
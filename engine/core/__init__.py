@@ -11,6 +11,12 @@ from .ceiling_panel_calc import (
     Material,
     PanelLayout,
     CeilingPanelCalculator,
+    calculate_batch,
+    make_cases,
+    CASE_DTYPE,
+    DIMENSIONS_DTYPE,
+    SPACING_DTYPE,
+    BATCH_RESULT_DTYPE,
     SVGGenerator,
     DXFGenerator,
     ProjectExporter,
@@ -37,6 +43,12 @@ __all__ = [
     'Material',
     'PanelLayout',
     'CeilingPanelCalculator',
+    'calculate_batch',
+    'make_cases',
+    'CASE_DTYPE',
+    'DIMENSIONS_DTYPE',
+    'SPACING_DTYPE',
+    'BATCH_RESULT_DTYPE',
     # Generators
     'SVGGenerator',
     'DXFGenerator',
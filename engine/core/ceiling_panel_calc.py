@@ -5,14 +5,41 @@ Generates optimized panel layouts with DXF export, measurements, and material sp
 """
 
 import json
-import math
 from dataclasses import dataclass, asdict
-from typing import List, Tuple, Dict, Optional
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional, Sequence, Union
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Packed forms of CeilingDimensions / PanelSpacing for batch work; field
+# names match the dataclass attributes
+DIMENSIONS_DTYPE = np.dtype([
+    ('length_mm', np.float64),
+    ('width_mm', np.float64),
+])
+
+SPACING_DTYPE = np.dtype([
+    ('perimeter_gap_mm', np.float64),
+    ('panel_gap_mm', np.float64),
+])
+
+
+@dataclass(frozen=True, slots=True)
 class CeilingDimensions:
     """Ceiling dimensions in millimeters"""
     length_mm: float  # X-axis
@@ -20,13 +47,35 @@ class CeilingDimensions:
     
     def to_meters(self) -> Tuple[float, float]:
         return self.length_mm / 1000, self.width_mm / 1000
+    
+    @staticmethod
+    def to_array(ceilings: Sequence['CeilingDimensions']) -> np.ndarray:
+        """Pack ceilings into a DIMENSIONS_DTYPE structured array"""
+        return np.array([(c.length_mm, c.width_mm) for c in ceilings], dtype=DIMENSIONS_DTYPE)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> List['CeilingDimensions']:
+        """Unpack a structured array with length_mm/width_mm fields"""
+        return [cls(length, width) for length, width
+                in zip(array['length_mm'].tolist(), array['width_mm'].tolist())]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PanelSpacing:
     """Gap specifications in millimeters"""
     perimeter_gap_mm: float      # Gap around ceiling edge
     panel_gap_mm: float          # Gap between panels
+    
+    @staticmethod
+    def to_array(spacings: Sequence['PanelSpacing']) -> np.ndarray:
+        """Pack spacings into a SPACING_DTYPE structured array"""
+        return np.array([(s.perimeter_gap_mm, s.panel_gap_mm) for s in spacings], dtype=SPACING_DTYPE)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> List['PanelSpacing']:
+        """Unpack a structured array with perimeter_gap_mm/panel_gap_mm fields"""
+        return [cls(perimeter, gap) for perimeter, gap
+                in zip(array['perimeter_gap_mm'].tolist(), array['panel_gap_mm'].tolist())]
 
 
 @dataclass
@@ -40,7 +89,7 @@ class Material:
     notes: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PanelLayout:
     """Calculated panel layout"""
     panel_width_mm: float
@@ -55,6 +104,171 @@ class PanelLayout:
         return asdict(self)
 
 
+# Largest panel count tried along each ceiling dimension
+_MAX_PANELS_PER_SIDE = 29
+
+
+@njit(cache=True)
+def _search_kernel(available_length, available_width, panel_gap_mm, target_aspect_ratio):
+    """
+    Scan every (panels_length, panels_width) pair and record each new best.
+    
+    Returns:
+        (k, 2) int64 panel counts and (k, 3) float64 (panel_length,
+        panel_width, efficiency) rows, in the order the best improved
+    """
+    n_max = _MAX_PANELS_PER_SIDE
+    counts = np.empty((n_max * n_max, 2), np.int64)
+    sizes = np.empty((n_max * n_max, 3), np.float64)
+    n = 0
+    best_efficiency = 0.0
+    
+    for panels_length in range(1, n_max + 1):
+        for panels_width in range(1, n_max + 1):
+            # Calculate panel size with gaps
+            panel_length = (available_length - (panels_length - 1) * panel_gap_mm) / panels_length
+            panel_width = (available_width - (panels_width - 1) * panel_gap_mm) / panels_width
+            
+            if panel_length > 0 and panel_width > 0:
+                # Calculate efficiency (how close to target aspect ratio)
+                actual_ratio = panel_width / panel_length
+                ratio_error = abs(actual_ratio - target_aspect_ratio)
+                
+                # Prefer larger panels (less waste) and better aspect ratios
+                panel_area = panel_length * panel_width
+                efficiency = (panel_area / (available_length * available_width)) * (1 / (1 + ratio_error))
+                
+                if efficiency > best_efficiency:
+                    best_efficiency = efficiency
+                    counts[n, 0] = panels_length
+                    counts[n, 1] = panels_width
+                    sizes[n, 0] = panel_length
+                    sizes[n, 1] = panel_width
+                    sizes[n, 2] = efficiency
+                    n += 1
+    
+    return counts[:n], sizes[:n]
+
+
+@lru_cache(maxsize=256)
+def _search_layouts(length_mm: float, width_mm: float, perimeter_gap_mm: float,
+                    panel_gap_mm: float,
+                    target_aspect_ratio: float) -> Tuple[Tuple[PanelLayout, float], ...]:
+    """
+    Search panel counts per dimension for the most efficient layout.
+    
+    Memoized on the scalar inputs; PanelLayout is frozen, so cached
+    results are shared safely between calculators.
+    
+    Returns:
+        Each successive best (layout, efficiency score), the optimum last;
+        empty if no layout fits
+    """
+    # Available space (ceiling minus perimeter gaps)
+    available_length = length_mm - (2 * perimeter_gap_mm)
+    available_width = width_mm - (2 * perimeter_gap_mm)
+    
+    counts, sizes = _search_kernel(float(available_length), float(available_width),
+                                   float(panel_gap_mm), float(target_aspect_ratio))
+    
+    improvements = []
+    for (panels_length, panels_width), (panel_length, panel_width, efficiency) in zip(
+            counts.tolist(), sizes.tolist()):
+        improvements.append((PanelLayout(
+            panel_width_mm=panel_width,
+            panel_length_mm=panel_length,
+            panels_per_row=panels_width,
+            panels_per_column=panels_length,
+            total_panels=panels_length * panels_width,
+            total_coverage_sqm=(panel_length * panel_width * panels_length * panels_width) / 1_000_000,
+            gap_area_sqm=(length_mm * width_mm - 
+                        panel_length * panel_width * panels_length * panels_width) / 1_000_000
+        ), efficiency))
+    
+    return tuple(improvements)
+
+
+# Batch input: one row per ceiling, all dimensions in millimeters
+CASE_DTYPE = np.dtype(DIMENSIONS_DTYPE.descr + SPACING_DTYPE.descr)
+
+# Batch output: panel counts are 0 and sizes NaN where no layout fits
+BATCH_RESULT_DTYPE = np.dtype([
+    ('panels_per_row', np.int64),
+    ('panels_per_column', np.int64),
+    ('panel_width_mm', np.float64),
+    ('panel_length_mm', np.float64),
+    ('efficiency', np.float64),
+])
+
+
+def make_cases(ceilings: Union[Sequence[CeilingDimensions], np.ndarray],
+               spacings: Union[PanelSpacing, Sequence[PanelSpacing], np.ndarray]) -> np.ndarray:
+    """
+    Build a CASE_DTYPE array for calculate_batch.
+
+    Args:
+        ceilings: CeilingDimensions objects or a DIMENSIONS_DTYPE array
+        spacings: One PanelSpacing for every ceiling, or one per ceiling
+            (objects or a SPACING_DTYPE array)
+    """
+    if not isinstance(ceilings, np.ndarray):
+        ceilings = CeilingDimensions.to_array(ceilings)
+    if isinstance(spacings, PanelSpacing):
+        spacings = [spacings]
+    if not isinstance(spacings, np.ndarray):
+        spacings = PanelSpacing.to_array(spacings)
+    
+    cases = np.empty(ceilings.shape[0], dtype=CASE_DTYPE)
+    for name in DIMENSIONS_DTYPE.names:
+        cases[name] = ceilings[name]
+    for name in SPACING_DTYPE.names:
+        cases[name] = spacings[name]
+    return cases
+
+
+@njit(cache=True)
+def _batch_kernel(lengths, widths, perimeter_gaps, panel_gaps, target_aspect_ratio,
+                  panels_per_row, panels_per_column, panel_width, panel_length, efficiency):
+    """Run the layout search for every case, keeping only each optimum"""
+    for i in range(lengths.shape[0]):
+        counts, sizes = _search_kernel(lengths[i] - 2 * perimeter_gaps[i],
+                                       widths[i] - 2 * perimeter_gaps[i],
+                                       panel_gaps[i], target_aspect_ratio)
+        n = counts.shape[0]
+        if n == 0:
+            continue
+        panels_per_column[i] = counts[n - 1, 0]
+        panels_per_row[i] = counts[n - 1, 1]
+        panel_length[i] = sizes[n - 1, 0]
+        panel_width[i] = sizes[n - 1, 1]
+        efficiency[i] = sizes[n - 1, 2]
+
+
+def calculate_batch(cases: np.ndarray, target_aspect_ratio: float = 1.0) -> np.ndarray:
+    """
+    Calculate the optimal layout for many ceilings in one pass.
+
+    Args:
+        cases: Structured array with the CASE_DTYPE fields
+        target_aspect_ratio: Panel width/length ratio (1.0 = square)
+
+    Returns:
+        BATCH_RESULT_DTYPE array, one row per case
+    """
+    cases = np.asarray(cases)
+    results = np.zeros(cases.shape[0], dtype=BATCH_RESULT_DTYPE)
+    results['panel_width_mm'] = np.nan
+    results['panel_length_mm'] = np.nan
+    results['efficiency'] = np.nan
+
+    columns = [np.ascontiguousarray(cases[name], dtype=np.float64) for name in CASE_DTYPE.names]
+    outputs = [np.ascontiguousarray(results[name]) for name in BATCH_RESULT_DTYPE.names]
+    _batch_kernel(*columns, float(target_aspect_ratio), *outputs)
+    for name, column in zip(BATCH_RESULT_DTYPE.names, outputs):
+        results[name] = column
+    return results
+
+
 class CeilingPanelCalculator:
     """Core calculation engine for ceiling panel layouts"""
     
@@ -73,52 +287,25 @@ class CeilingPanelCalculator:
         Returns:
             Optimized PanelLayout
         """
-        # Available space (ceiling minus perimeter gaps)
-        available_length = self.ceiling.length_mm - (2 * self.spacing.perimeter_gap_mm)
-        available_width = self.ceiling.width_mm - (2 * self.spacing.perimeter_gap_mm)
-        
-        best_layout = None
-        best_efficiency = 0
-        
-        # Try different numbers of panels per dimension
-        for panels_length in range(1, 30):
-            for panels_width in range(1, 30):
-                # Calculate panel size with gaps
-                panel_length = (available_length - (panels_length - 1) * self.spacing.panel_gap_mm) / panels_length
-                panel_width = (available_width - (panels_width - 1) * self.spacing.panel_gap_mm) / panels_width
-                
-                if panel_length > 0 and panel_width > 0:
-                    # Calculate efficiency (how close to target aspect ratio)
-                    actual_ratio = panel_width / panel_length
-                    ratio_error = abs(actual_ratio - target_aspect_ratio)
-                    
-                    # Prefer larger panels (less waste) and better aspect ratios
-                    panel_area = panel_length * panel_width
-                    efficiency = (panel_area / (available_length * available_width)) * (1 / (1 + ratio_error))
-                    
-                    if efficiency > best_efficiency:
-                        best_efficiency = efficiency
-                        best_layout = PanelLayout(
-                            panel_width_mm=panel_width,
-                            panel_length_mm=panel_length,
-                            panels_per_row=panels_width,
-                            panels_per_column=panels_length,
-                            total_panels=panels_length * panels_width,
-                            total_coverage_sqm=(panel_length * panel_width * panels_length * panels_width) / 1_000_000,
-                            gap_area_sqm=(self.ceiling.length_mm * self.ceiling.width_mm - 
-                                        panel_length * panel_width * panels_length * panels_width) / 1_000_000
-                        )
-                        self.layouts.append((best_layout, efficiency))
-        
-        if best_layout is None:
+        improvements = _search_layouts(
+            self.ceiling.length_mm, self.ceiling.width_mm,
+            self.spacing.perimeter_gap_mm, self.spacing.panel_gap_mm,
+            target_aspect_ratio
+        )
+        
+        if not improvements:
             raise ValueError("Could not calculate valid panel layout with given constraints")
         
-        return best_layout
+        self.layouts.extend(improvements)
+        return improvements[-1][0]
     
     def get_alternate_layouts(self, count: int = 5) -> List[Tuple[PanelLayout, float]]:
         """Get top N alternative layouts ranked by efficiency"""
-        sorted_layouts = sorted(self.layouts, key=lambda x: x[1], reverse=True)
-        return sorted_layouts[:count]
+        efficiencies = np.fromiter((efficiency for _, efficiency in self.layouts),
+                                   dtype=np.float64, count=len(self.layouts))
+        # Stable descending order keeps equal scores in discovery order
+        ranked = np.argsort(-efficiencies, kind='stable')[:count]
+        return [self.layouts[i] for i in ranked.tolist()]
     
     def validate_layout(self, layout: PanelLayout) -> bool:
         """Verify layout fits ceiling with specified gaps"""
@@ -272,22 +459,24 @@ class SVGGenerator:
         panel_h = self.layout.panel_length_mm * self.scale
         gap = self.spacing.panel_gap_mm * self.scale
         
-        for row in range(self.layout.panels_per_column):
-            for col in range(self.layout.panels_per_row):
-                x = start_x + col * (panel_w + gap)
-                y = start_y + row * (panel_h + gap)
-                
-                svg_lines.append(
-                    f'<rect class="panel" x="{x}" y="{y}" width="{panel_w}" height="{panel_h}"/>'
-                )
-                
-                # Panel label
-                label_x = x + panel_w / 2
-                label_y = y + panel_h / 2
-                panel_num = row * self.layout.panels_per_row + col + 1
-                svg_lines.append(
-                    f'<text class="text" x="{label_x}" y="{label_y}" text-anchor="middle">P{panel_num}</text>'
-                )
+        # Panel origins for the whole grid, row-major so labels run P1..Pn
+        rows, cols = np.divmod(
+            np.arange(self.layout.panels_per_row * self.layout.panels_per_column),
+            max(self.layout.panels_per_row, 1),
+        )
+        xs = start_x + cols * (panel_w + gap)
+        ys = start_y + rows * (panel_h + gap)
+        for num, (x, y, label_x, label_y) in enumerate(
+            zip(xs.tolist(), ys.tolist(),
+                (xs + panel_w / 2).tolist(), (ys + panel_h / 2).tolist()),
+            start=1,
+        ):
+            svg_lines.append(
+                f'<rect class="panel" x="{x}" y="{y}" width="{panel_w}" height="{panel_h}"/>'
+            )
+            svg_lines.append(
+                f'<text class="text" x="{label_x}" y="{label_y}" text-anchor="middle">P{num}</text>'
+            )
         
         # Add title and specs
         svg_lines.append(
@@ -310,8 +499,7 @@ class SVGGenerator:
         
         svg_lines.append('</svg>')
         
-        with open(filename, 'w') as f:
-            f.write('\n'.join(svg_lines))
+        Path(filename).write_text('\n'.join(svg_lines))
         
         print(f"✓ SVG saved: {filename}")
 
@@ -380,9 +568,10 @@ class MaterialLibrary:
     
     @classmethod
     def get_material(cls, key: str) -> Material:
-        if key not in cls.MATERIALS:
-            raise ValueError(f"Unknown material: {key}. Available: {list(cls.MATERIALS.keys())}")
-        return cls.MATERIALS[key]
+        try:
+            return cls.MATERIALS[key]
+        except KeyError:
+            raise ValueError(f"Unknown material: {key}. Available: {list(cls.MATERIALS.keys())}") from None
     
     @classmethod
     def list_materials(cls):
@@ -394,11 +583,30 @@ class ProjectExporter:
     """Export project specifications and reports"""
     
     def __init__(self, ceiling: CeilingDimensions, spacing: PanelSpacing, 
-                 layout: PanelLayout, material: Material):
+                 layout: PanelLayout, material: Material,
+                 waste_factor: float = 0.15, labor_multiplier: Optional[float] = None):
         self.ceiling = ceiling
         self.spacing = spacing
         self.layout = layout
         self.material = material
+        self.waste_factor = waste_factor          # Extra material ordered, fraction of base
+        self.labor_multiplier = labor_multiplier  # Labor as a fraction of material cost
+        # Layout and material are fixed per exporter; only the multipliers vary
+        self._base_material_cost = layout.total_coverage_sqm * material.cost_per_sqm
+    
+    def _calculate_costs(self) -> Dict[str, float]:
+        """Break the project cost down into material, waste and labor"""
+        material_cost = self._base_material_cost
+        waste_cost = material_cost * self.waste_factor
+        total_material_cost = material_cost + waste_cost
+        labor_cost = total_material_cost * (self.labor_multiplier or 0.0)
+        return {
+            'material_cost': material_cost,
+            'waste_cost': waste_cost,
+            'total_material_cost': total_material_cost,
+            'labor_cost': labor_cost,
+            'total_cost': total_material_cost + labor_cost,
+        }
     
     def generate_report(self, filename: str):
         """Generate comprehensive project report"""
@@ -23,6 +23,11 @@ from .mep_systems import (
     PlumbingDesign,
 )
 
+from .mep_routing import (
+    astar_grid,
+    route_to_points,
+)
+
 from .multi_story_designer import (
     MultiStoryDesigner,
     Floor,
@@ -80,6 +85,8 @@ __all__ = [
     'HVACDesign',
     'ElectricalDesign',
     'PlumbingDesign',
+    'astar_grid',
+    'route_to_points',
     # Multi-story
     'MultiStoryDesigner',
     'Floor',
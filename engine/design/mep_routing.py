@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+MEP Grid Routing
+================
+Shortest-path routing for plumbing (and other MEP) runs on an occupancy grid.
+
+The search runs on flat NumPy arrays (uint8 obstacle grid, int32 cost and
+predecessor arrays, array-backed binary heap) so the kernel compiles under
+Numba when it is installed and still runs as plain Python when it is not.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+_UNREACHED = 2**31 - 1
+
+
+@njit(cache=True)
+def _heap_push(keys, nodes, size, key, node):
+    """Push (key, node) onto the array-backed min-heap; return new size"""
+    i = size
+    keys[i] = key
+    nodes[i] = node
+    while i > 0:
+        parent = (i - 1) // 2
+        if keys[parent] <= keys[i]:
+            break
+        keys[parent], keys[i] = keys[i], keys[parent]
+        nodes[parent], nodes[i] = nodes[i], nodes[parent]
+        i = parent
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(keys, nodes, size):
+    """Pop the minimum node from the heap; return (node, new size)"""
+    node = nodes[0]
+    size -= 1
+    keys[0] = keys[size]
+    nodes[0] = nodes[size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= size:
+            break
+        child = left
+        if left + 1 < size and keys[left + 1] < keys[left]:
+            child = left + 1
+        if keys[i] <= keys[child]:
+            break
+        keys[child], keys[i] = keys[i], keys[child]
+        nodes[child], nodes[i] = nodes[i], nodes[child]
+        i = child
+    return node, size
+
+
+@njit(cache=True)
+def _astar_kernel(grid, start_row, start_col, goal_row, goal_col):
+    """4-connected A* with a Manhattan heuristic; returns the predecessor array"""
+    rows, cols = grid.shape
+    n = rows * cols
+    cost = np.full(n, _UNREACHED, np.int32)
+    pred = np.full(n, -1, np.int32)
+    closed = np.zeros(n, np.uint8)
+
+    # Each cell is pushed at most once per incoming edge
+    keys = np.empty(4 * n + 1, np.int64)
+    nodes = np.empty(4 * n + 1, np.int32)
+
+    start = start_row * cols + start_col
+    goal = goal_row * cols + goal_col
+    cost[start] = 0
+    size = _heap_push(keys, nodes, 0,
+                      abs(start_row - goal_row) + abs(start_col - goal_col), start)
+
+    d_row = (-1, 1, 0, 0)
+    d_col = (0, 0, -1, 1)
+
+    while size > 0:
+        node, size = _heap_pop(keys, nodes, size)
+        if closed[node]:
+            continue
+        if node == goal:
+            break
+        closed[node] = 1
+
+        row = node // cols
+        col = node % cols
+        for k in range(4):
+            r = row + d_row[k]
+            c = col + d_col[k]
+            if r < 0 or r >= rows or c < 0 or c >= cols or grid[r, c]:
+                continue
+            neighbor = r * cols + c
+            new_cost = cost[node] + 1
+            if new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                pred[neighbor] = node
+                size = _heap_push(keys, nodes, size,
+                                  new_cost + abs(r - goal_row) + abs(c - goal_col),
+                                  neighbor)
+
+    return pred
+
+
+def astar_grid(grid: np.ndarray, start: Tuple[int, int],
+               goal: Tuple[int, int]) -> np.ndarray:
+    """
+    Find a shortest 4-connected path across an obstacle grid.
+
+    Args:
+        grid: 2D array, non-zero cells are obstacles
+        start: (row, col) of the source cell
+        goal: (row, col) of the sink cell
+
+    Returns:
+        (k, 2) int32 array of (row, col) cells from start to goal,
+        empty if the goal is unreachable
+    """
+    grid = np.ascontiguousarray(grid, dtype=np.uint8)
+    rows, cols = grid.shape
+    for row, col in (start, goal):
+        if not (0 <= row < rows and 0 <= col < cols):
+            raise ValueError(f"Cell ({row}, {col}) is outside the {rows}x{cols} grid")
+        if grid[row, col]:
+            raise ValueError(f"Cell ({row}, {col}) is blocked")
+
+    pred = _astar_kernel(grid, int(start[0]), int(start[1]),
+                         int(goal[0]), int(goal[1]))
+
+    start_node = start[0] * cols + start[1]
+    node = goal[0] * cols + goal[1]
+    if node != start_node and pred[node] < 0:
+        return np.empty((0, 2), dtype=np.int32)
+
+    path = [node]
+    while node != start_node:
+        node = pred[node]
+        path.append(node)
+    path = np.array(path[::-1], dtype=np.int32)
+    return np.stack([path // cols, path % cols], axis=1).astype(np.int32)
+
+
+def route_to_points(path: np.ndarray, cell_size: float,
+                    origin: Tuple[float, float] = (0.0, 0.0)) -> np.ndarray:
+    """Convert a cell path into (k, 2) world coordinates at cell centres"""
+    path = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+    xy = (path[:, ::-1] + 0.5) * cell_size
+    return (xy + np.asarray(origin, dtype=np.float64)).astype(np.float32)
@@ -287,7 +287,7 @@ class MultiStoryDesigner:
     def calculate_required_elevators(self) -> int:
         """Calculate required elevators based on occupancy."""
         total_occupancy = sum(f.total_occupancy for f in self.floors)
-        return max(1, math.ceil(total_occupancy / self.CODES['min_elevator_count_per_occupancy']))
+        return max(1, -(-total_occupancy // self.CODES['min_elevator_count_per_occupancy']))
 
     def calculate_required_stairs(self) -> int:
         """Calculate required stairs based on travel distance and occupancy."""
@@ -17,6 +17,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from datetime import datetime
 
+import numpy as np
+
 
 class ZoningType(Enum):
     """Zoning classifications."""
@@ -221,10 +223,66 @@ class SitePlanner:
         Returns:
             SiteAnalysisResult with analysis and compliance status
         """
+        batch = self.analyze_site_batch(
+            [proposed_gfa_sqm], [proposed_height_m], [proposed_footprint_sqm]
+        )
+        max_footprint = batch['max_footprint_sqm']
+        buildable_area = batch['buildable_area_sqm']
+        max_gfa = batch['max_gfa_sqm']
+        max_height = batch['max_height_m']
+
+        issues = []
+
+        if not batch['coverage_ok'][0]:
+            issues.append(f"Footprint exceeds max coverage: {proposed_footprint_sqm:.0f} > {max_footprint:.0f} sqm")
+
+        if not batch['buildable_ok'][0]:
+            issues.append(f"Footprint exceeds buildable area: {proposed_footprint_sqm:.0f} > {buildable_area:.0f} sqm")
+
+        if not batch['far_ok'][0]:
+            issues.append(f"GFA exceeds FAR limit: {proposed_gfa_sqm:.0f} > {max_gfa:.0f} sqm")
+
+        if not batch['height_ok'][0]:
+            issues.append(f"Height exceeds limit: {proposed_height_m:.0f} > {max_height:.0f} m")
+
+        if not batch['open_space_ok'][0]:
+            issues.append("Insufficient area for parking and green space")
+
+        return SiteAnalysisResult(
+            buildable_area_sqm=round(buildable_area, 2),
+            max_building_footprint_sqm=round(min(max_footprint, buildable_area), 2),
+            max_gross_floor_area_sqm=round(max_gfa, 2),
+            max_building_height_m=max_height,
+            required_parking_spaces=int(batch['required_parking_spaces'][0]),
+            required_green_space_sqm=round(batch['required_green_space_sqm'], 2),
+            zoning_compliance=bool(batch['compliant'][0]),
+            issues=issues
+        )
+
+    def analyze_site_batch(self, proposed_gfa_sqm, proposed_height_m,
+                           proposed_footprint_sqm) -> Dict[str, Any]:
+        """
+        Analyze many building proposals against the current site at once.
+
+        The three arguments are broadcast against each other, so a sweep can
+        pass e.g. a grid of GFAs with a single height and footprint.
+
+        Returns:
+            Dict with the site limits as floats ('buildable_area_sqm',
+            'max_footprint_sqm', 'max_gfa_sqm', 'max_height_m',
+            'required_green_space_sqm') and one array entry per proposal:
+            'required_parking_spaces', the individual checks ('coverage_ok',
+            'buildable_ok', 'far_ok', 'height_ok', 'open_space_ok') and
+            their conjunction 'compliant'.
+        """
         if not self.site or not self.zoning:
             raise ValueError("Site and zoning must be set before analysis")
 
-        issues = []
+        gfa, height, footprint = np.broadcast_arrays(
+            np.asarray(proposed_gfa_sqm, dtype=float),
+            np.asarray(proposed_height_m, dtype=float),
+            np.asarray(proposed_footprint_sqm, dtype=float),
+        )
 
         # Calculate buildable area (after setbacks)
         setbacks = self.zoning.setbacks
@@ -242,48 +300,33 @@ class SitePlanner:
         max_height = self.zoning.max_height_m
 
         # Required parking
-        required_parking = math.ceil((proposed_gfa_sqm / 100) * self.zoning.min_parking_ratio)
+        required_parking = np.ceil((gfa / 100) * self.zoning.min_parking_ratio).astype(int)
 
         # Required green space
         required_green = self.site.total_area_sqm * (self.zoning.min_green_space_pct / 100)
 
-        # Check compliance
-        compliance = True
-
-        if proposed_footprint_sqm > max_footprint:
-            issues.append(f"Footprint exceeds max coverage: {proposed_footprint_sqm:.0f} > {max_footprint:.0f} sqm")
-            compliance = False
-
-        if proposed_footprint_sqm > buildable_area:
-            issues.append(f"Footprint exceeds buildable area: {proposed_footprint_sqm:.0f} > {buildable_area:.0f} sqm")
-            compliance = False
-
-        if proposed_gfa_sqm > max_gfa:
-            issues.append(f"GFA exceeds FAR limit: {proposed_gfa_sqm:.0f} > {max_gfa:.0f} sqm")
-            compliance = False
-
-        if proposed_height_m > max_height:
-            issues.append(f"Height exceeds limit: {proposed_height_m:.0f} > {max_height:.0f} m")
-            compliance = False
-
-        # Check remaining area for parking and green space
-        remaining = self.site.total_area_sqm - proposed_footprint_sqm
+        # Remaining area must hold parking and green space
+        remaining = self.site.total_area_sqm - footprint
         parking_area_needed = self.calculate_parking_area(required_parking, ParkingType.SURFACE)
 
-        if remaining < required_green + parking_area_needed:
-            issues.append("Insufficient area for parking and green space")
-            compliance = False
+        checks = {
+            'coverage_ok': footprint <= max_footprint,
+            'buildable_ok': footprint <= buildable_area,
+            'far_ok': gfa <= max_gfa,
+            'height_ok': height <= max_height,
+            'open_space_ok': remaining >= required_green + parking_area_needed,
+        }
 
-        return SiteAnalysisResult(
-            buildable_area_sqm=round(buildable_area, 2),
-            max_building_footprint_sqm=round(min(max_footprint, buildable_area), 2),
-            max_gross_floor_area_sqm=round(max_gfa, 2),
-            max_building_height_m=max_height,
-            required_parking_spaces=required_parking,
-            required_green_space_sqm=round(required_green, 2),
-            zoning_compliance=compliance,
-            issues=issues
-        )
+        return {
+            'buildable_area_sqm': buildable_area,
+            'max_footprint_sqm': max_footprint,
+            'max_gfa_sqm': max_gfa,
+            'max_height_m': max_height,
+            'required_green_space_sqm': required_green,
+            'required_parking_spaces': required_parking,
+            **checks,
+            'compliant': np.logical_and.reduce(list(checks.values())),
+        }
 
     def calculate_parking_area(self, spaces: int, parking_type: ParkingType) -> float:
         """Calculate parking area required."""
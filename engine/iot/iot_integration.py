@@ -19,6 +19,8 @@ from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
 from datetime import datetime
 
+import numpy as np
+
 from iot_sensor_network import SensorType, SensorData, SensorNetworkManager
 
 
@@ -112,7 +114,7 @@ class IoTIntegrationEngine:
             # Optimize placement using grid pattern
             grid_size = math.sqrt(num_sensors)
             grid_x = math.ceil(grid_size)
-            grid_y = math.ceil(num_sensors / grid_x)
+            grid_y = -(-num_sensors // grid_x)
             
             # Calculate spacing
             spacing_x = building_area / (grid_x * 2) if grid_x > 0 else 0
@@ -172,14 +174,15 @@ class IoTIntegrationEngine:
     
     def optimize_energy_consumption(self,
                                    building_area: float,
-                                   occupancy_patterns: Dict[str, List[int]],
+                                   occupancy_patterns: Dict[str, Any],
                                    current_energy_cost: float) -> EnergyOptimization:
         """
         Optimize energy consumption based on occupancy and sensor data.
         
         Args:
             building_area: Building area in m²
-            occupancy_patterns: Hourly occupancy (0-23)
+            occupancy_patterns: Hourly occupancy (0-23) per day type, as
+                lists or arrays
             current_energy_cost: Current monthly energy cost
         
         Returns:
@@ -195,7 +198,8 @@ class IoTIntegrationEngine:
         base_savings = 0.30  # 30% base savings
         
         # Adjust based on occupancy patterns
-        peak_hours = sum(1 for hour in range(24) if occupancy_patterns.get("weekday", [0]*24)[hour] > 0)
+        weekday = np.asarray(occupancy_patterns.get("weekday", np.zeros(24)))
+        peak_hours = int(np.count_nonzero(weekday[:24] > 0))
         if peak_hours > 12:
             base_savings += 0.05  # More savings for high occupancy buildings
         
@@ -14,12 +14,14 @@ import time
 import json
 import random
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable
 from datetime import datetime, timedelta
 from enum import Enum
 from collections import deque
 import threading
 
+import numpy as np
+
 
 class AlertSeverity(Enum):
     """Alert severity levels."""
@@ -170,54 +172,87 @@ class MonitoringDashboard:
 
     def ingest_reading(self, reading: SensorReading) -> None:
         """Ingest a sensor reading."""
-        if reading.sensor_id not in self.sensors:
+        self.ingest_readings((reading,))
+
+    def ingest_readings(self, readings: Iterable[SensorReading]) -> None:
+        """
+        Ingest a batch of sensor readings.
+
+        Readings from unregistered sensors are dropped. Thresholds for the
+        whole batch are evaluated in one pass; alerts are raised in reading
+        order, exactly as if each reading had been ingested on its own.
+        """
+        accepted = [r for r in readings if r.sensor_id in self.sensors]
+        if not accepted:
             return
 
-        # Store reading
-        self.metric_buffers[reading.sensor_id].add(reading)
+        for reading in accepted:
+            # Store reading
+            self.metric_buffers[reading.sensor_id].add(reading)
 
-        # Update sensor status
-        sensor = self.sensors[reading.sensor_id]
-        sensor['last_reading'] = reading.value
-        sensor['last_update'] = reading.timestamp
-        sensor['status'] = 'online'
+            # Update sensor status
+            sensor = self.sensors[reading.sensor_id]
+            sensor['last_reading'] = reading.value
+            sensor['last_update'] = reading.timestamp
+            sensor['status'] = 'online'
 
         # Check thresholds
-        self._check_thresholds(reading)
-
-    def _check_thresholds(self, reading: SensorReading) -> None:
-        """Check if reading exceeds thresholds."""
-        thresholds = self.thresholds.get(reading.metric_type)
-        if not thresholds:
-            return
-
-        value = reading.value
-
-        # Check critical thresholds first
-        if value < thresholds.get('critical_min', float('-inf')):
-            self._create_alert(
-                AlertSeverity.CRITICAL,
-                reading.sensor_id,
-                f"CRITICAL LOW: {reading.metric_type.value} = {value} (below {thresholds['critical_min']})"
-            )
-        elif value > thresholds.get('critical_max', float('inf')):
-            self._create_alert(
-                AlertSeverity.CRITICAL,
-                reading.sensor_id,
-                f"CRITICAL HIGH: {reading.metric_type.value} = {value} (above {thresholds['critical_max']})"
-            )
-        # Check warning thresholds
-        elif value < thresholds.get('min', float('-inf')):
-            self._create_alert(
-                AlertSeverity.WARNING,
-                reading.sensor_id,
-                f"Warning: {reading.metric_type.value} = {value} (below {thresholds['min']})"
-            )
-        elif value > thresholds.get('max', float('inf')):
+        self._check_thresholds(accepted)
+
+    # (threshold key, severity, message) in the order a reading is checked
+    _THRESHOLD_CHECKS = (
+        ('critical_min', AlertSeverity.CRITICAL, "CRITICAL LOW: {metric} = {value} (below {limit})"),
+        ('critical_max', AlertSeverity.CRITICAL, "CRITICAL HIGH: {metric} = {value} (above {limit})"),
+        ('min', AlertSeverity.WARNING, "Warning: {metric} = {value} (below {limit})"),
+        ('max', AlertSeverity.WARNING, "Warning: {metric} = {value} (above {limit})"),
+    )
+
+    def _classify_readings(self, readings: List[SensorReading]) -> np.ndarray:
+        """
+        Index into _THRESHOLD_CHECKS of the first limit each reading breaches,
+        or -1 when it is within limits or its metric has no thresholds.
+        """
+        metric_types = list(self.thresholds)
+        row_of = {metric: row for row, metric in enumerate(metric_types)}
+
+        # One row of limits per metric type; the last row never breaches
+        limits = np.empty((len(metric_types) + 1, 4))
+        limits[:, 0::2] = -np.inf
+        limits[:, 1::2] = np.inf
+        for row, metric in enumerate(metric_types):
+            for col, (key, _, _) in enumerate(self._THRESHOLD_CHECKS):
+                if key in self.thresholds[metric]:
+                    limits[row, col] = self.thresholds[metric][key]
+
+        rows = np.fromiter(
+            (row_of.get(r.metric_type, -1) for r in readings),
+            dtype=np.intp, count=len(readings),
+        )
+        values = np.fromiter((r.value for r in readings), dtype=float, count=len(readings))
+        lim = np.take(limits, rows, axis=0)
+
+        breaches = np.column_stack((
+            values < lim[:, 0],
+            values > lim[:, 1],
+            values < lim[:, 2],
+            values > lim[:, 3],
+        ))
+        return np.where(breaches.any(axis=1), breaches.argmax(axis=1), -1)
+
+    def _check_thresholds(self, readings: List[SensorReading]) -> None:
+        """Raise an alert for every reading that exceeds its thresholds."""
+        levels = self._classify_readings(readings)
+        for idx in np.flatnonzero(levels >= 0).tolist():
+            reading = readings[idx]
+            key, severity, template = self._THRESHOLD_CHECKS[levels[idx]]
             self._create_alert(
-                AlertSeverity.WARNING,
+                severity,
                 reading.sensor_id,
-                f"Warning: {reading.metric_type.value} = {value} (above {thresholds['max']})"
+                template.format(
+                    metric=reading.metric_type.value,
+                    value=reading.value,
+                    limit=self.thresholds[reading.metric_type][key],
+                )
             )
 
     def _create_alert(self, severity: AlertSeverity, source: str, message: str) -> Alert:
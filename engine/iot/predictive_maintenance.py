@@ -16,9 +16,35 @@ from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 from iot_sensor_network import SensorData, SensorType, SensorNetworkManager
 
 
+@njit(cache=True)
+def _zscore_anomalies(values, threshold):
+    """Flag readings more than threshold standard deviations from the mean"""
+    flags = np.zeros(values.shape[0], dtype=np.bool_)
+    std = values.std()
+    if std == 0.0:
+        return flags
+    mean = values.mean()
+    limit = threshold * std
+    for i in range(values.shape[0]):
+        flags[i] = abs(values[i] - mean) > limit
+    return flags
+
+
 class MaintenancePriority(Enum):
     """Maintenance priority levels"""
     LOW = "low"
@@ -236,6 +262,17 @@ class PredictiveMaintenanceEngine:
 
         return issues
 
+    def detect_anomalies(self, sensor_id: str, values: Optional[Any] = None,
+                         threshold: float = 3.0) -> List[int]:
+        """Return indices of readings more than `threshold` standard deviations
+        from the mean; reads the last 24 hours for `sensor_id` if no values given"""
+        if values is None:
+            values = [d.value for d in self.sensor_network.get_sensor_data(sensor_id)]
+        values = np.asarray(values, dtype=np.float64)
+        if values.size < 2:
+            return []
+        return np.flatnonzero(_zscore_anomalies(values, float(threshold))).tolist()
+
     def predict_panel_maintenance(self, panel_id: str, installation_date: datetime,
                                 usage_cycles: int = 0) -> MaintenancePrediction:
         """Predict maintenance needs for ceiling panels"""
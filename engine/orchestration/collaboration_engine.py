@@ -88,31 +88,51 @@ class SyncMessage:
 
 
 class CRDTStore:
-    """Conflict-free Replicated Data Type store"""
+    """Conflict-free Replicated Data Type store
+    
+    Each element is a last-writer-wins register ordered by
+    (timestamp, user_id, operation_id), and "modify" operations are
+    per-field LWW registers layered on top. Applying the same set of
+    operations in any order yields the same state, so replicas converge
+    by exchanging operations without a central re-serialization step.
+    """
     
     def __init__(self):
         self.state = {}  # Current state
         self.history = []  # Operation history
         self.vector_clock = {}  # Version vector
+        self._applied: Set[str] = set()  # Applied operation IDs
+        self._elements: Dict[str, tuple] = {}  # target -> (stamp, alive, base data)
+        self._fields: Dict[str, Dict[str, tuple]] = {}  # target -> field -> (stamp, value)
     
     def apply_operation(self, operation: DesignChange) -> bool:
         """Apply operation with CRDT semantics"""
         
         # Check if already applied (idempotency)
-        if any(op.operation_id == operation.operation_id for op in self.history):
+        if operation.operation_id in self._applied:
             return False
+        self._applied.add(operation.operation_id)
+        
+        stamp = (operation.timestamp, operation.user_id, operation.operation_id)
+        target = operation.target
+        current = self._elements.get(target)
         
         # Apply based on operation type
         if operation.operation_type == "add":
-            self.state[operation.target] = operation.data
-            
+            if current is None or stamp > current[0]:
+                self._elements[target] = (stamp, True, dict(operation.data))
+                
         elif operation.operation_type == "delete":
-            if operation.target in self.state:
-                del self.state[operation.target]
+            if current is None or stamp > current[0]:
+                self._elements[target] = (stamp, False, {})
                 
         elif operation.operation_type == "modify":
-            if operation.target in self.state:
-                self.state[operation.target].update(operation.data)
+            fields = self._fields.setdefault(target, {})
+            for key, value in operation.data.items():
+                if key not in fields or stamp > fields[key][0]:
+                    fields[key] = (stamp, value)
+        
+        self._materialize(target)
         
         # Add to history
         self.history.append(operation)
@@ -128,13 +148,27 @@ class CRDTStore:
         
         return True
     
+    def _materialize(self, target: str) -> None:
+        """Rebuild the visible value of one element from its registers"""
+        entry = self._elements.get(target)
+        if entry is None or not entry[1]:
+            self.state.pop(target, None)
+            return
+        
+        stamp, _, base = entry
+        value = dict(base)
+        for key, (field_stamp, field_value) in self._fields.get(target, {}).items():
+            # Only edits made after the winning add apply to this element
+            if field_stamp > stamp:
+                value[key] = field_value
+        self.state[target] = value
+    
     def get_state(self) -> Dict[str, Any]:
         """Get current state"""
         return self.state.copy()
     
     def merge(self, other_store: 'CRDTStore') -> bool:
-        """Merge with another CRDT store"""
-        # Simple last-write-wins for this example
+        """Merge with another CRDT store (commutative, idempotent)"""
         for op in other_store.history:
             self.apply_operation(op)
         return True
@@ -20,11 +20,38 @@ PHASE BREAKDOWN:
 All interfaces are defined here. Implementations come later.
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any, Tuple
+import sys
+import json
+import hashlib
+import inspect
+from abc import ABC, ABCMeta, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import List, Dict, Optional, Any, Tuple, Mapping, Sequence, FrozenSet
 from enum import Enum
 from datetime import datetime
+from types import MappingProxyType
+
+import numpy as np
+
+
+def _as_points(points: Any, dims: int, dtype: Any = np.float32) -> np.ndarray:
+    """Coerce a sequence of coordinate tuples into a contiguous (n, dims) array"""
+    return np.ascontiguousarray(points, dtype=dtype).reshape(-1, dims)
+
+
+def _fields_equal(self, other: Any) -> bool:
+    """Dataclass __eq__ that compares ndarray fields by value"""
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+    for f in fields(self):
+        mine, theirs = getattr(self, f.name), getattr(other, f.name)
+        if isinstance(mine, np.ndarray):
+            if not np.array_equal(mine, theirs):
+                return False
+        elif mine != theirs:
+            return False
+    return True
 
 
 # ============================================================================
@@ -57,6 +84,8 @@ class CosmicDesign:
 class ConsciousnessIntegrationInterface(ABC):
     """Phase 5 Sprint 12: Consciousness integration for empathic design"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def integrate_consciousness(self, design: Any, profile: ConsciousnessProfile) -> Any:
         """Integrate user consciousness into design"""
@@ -75,6 +104,8 @@ class ConsciousnessIntegrationInterface(ABC):
 class MetaverseInterface(ABC):
     """Phase 5 Sprint 11: Metaverse construction and holographic systems"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def construct_virtual_world(self, blueprint: Any) -> Any:
         """Build in metaverse"""
@@ -127,6 +158,8 @@ class StorageReference:
 class PlatformOmnipresenceInterface(ABC):
     """Phase 4 Sprint 10: Cross-reality platform omnipresence"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def deploy_cross_reality(self, design: Any, platforms: List[str]) -> Any:
         """Deploy to VR/AR/MR simultaneously"""
@@ -150,6 +183,8 @@ class PlatformOmnipresenceInterface(ABC):
 class EnterpriseInterface(ABC):
     """Phase 4 Sprint 9: Enterprise blockchain and AI systems"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def manage_blockchain_project(self, project: EnterpriseProject) -> Any:
         """Immutable project management"""
@@ -213,6 +248,8 @@ class ClimateReport:
 class SustainabilityOracleInterface(ABC):
     """Phase 3 Sprint 8: Zero-impact predictive sustainability"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def calculate_carbon_footprint(self, design: Any) -> CarbonReport:
         """Cradle-to-grave carbon analysis"""
@@ -268,6 +305,8 @@ class OptimizedDesign:
 class GenerativeAIInterface(ABC):
     """Phase 3 Sprint 7: AI that designs better than humans"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def generate_style(self, constraints: DesignConstraints, style: str) -> Any:
         """GAN-based architectural style generation"""
@@ -311,8 +350,13 @@ class MEPDesign:
     """MEP systems design"""
     hvac_zones: List[str]
     electrical_loads: List[float]
-    plumbing_routes: List[Tuple[float, float]]
+    plumbing_routes: np.ndarray  # (n, 2) float32
     efficiency_score: float
+    
+    __eq__ = _fields_equal
+    
+    def __post_init__(self):
+        self.plumbing_routes = _as_points(self.plumbing_routes, 2)
 
 @dataclass
 class MultiStoryDesign:
@@ -341,6 +385,8 @@ class ComplianceReport:
 class FullArchitecturalInterface(ABC):
     """Phase 2 Sprint 4: Complete architectural design"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def design_structure(self, loads: Any) -> StructuralDesign:
         """Structural engineering integration"""
@@ -369,9 +415,23 @@ class FullArchitecturalInterface(ABC):
 @dataclass
 class SensorLayout:
     """IoT sensor network design"""
-    sensor_positions: List[Tuple[float, float, float]]
+    sensor_positions: np.ndarray  # (n, 3) float32
     coverage_score: float
     redundancy: float
+    
+    __eq__ = _fields_equal
+    
+    def __post_init__(self):
+        self.sensor_positions = _as_points(self.sensor_positions, 3)
+    
+    def coverage_of(self, points: Any, radius: float) -> float:
+        """Fraction of sample points within radius of at least one sensor"""
+        samples = _as_points(points, 3)
+        if not len(samples) or not len(self.sensor_positions):
+            return 0.0
+        deltas = samples[:, None, :] - self.sensor_positions[None, :, :]
+        nearest = np.einsum('ijk,ijk->ij', deltas, deltas).min(axis=1)
+        return float((nearest <= radius * radius).mean())
 
 @dataclass
 class MaintenanceSchedule:
@@ -390,13 +450,20 @@ class EnergyOptimization:
 @dataclass
 class SecurityDesign:
     """Unified security system"""
-    access_points: List[Tuple[float, float]]
+    access_points: np.ndarray  # (n, 2) float32
     camera_coverage: float
     sensor_density: float
+    
+    __eq__ = _fields_equal
+    
+    def __post_init__(self):
+        self.access_points = _as_points(self.access_points, 2)
 
 class IoTIntegrationInterface(ABC):
     """Phase 2 Sprint 5: IoT and smart building integration"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def design_sensor_network(self, building: Any) -> SensorLayout:
         """Optimize sensor placement"""
@@ -426,7 +493,7 @@ class Session:
 
 @dataclass
 class DesignChange:
-    """Design change for collaboration"""
+    """Design change for collaboration (merged last-writer-wins on (timestamp, user))"""
     timestamp: datetime
     user: str
     changes: Dict[str, Any]
@@ -455,6 +522,8 @@ class OwnershipProof:
 class CollaborationInterface(ABC):
     """Phase 2 Sprint 6: Global collaboration and blockchain ownership"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def join_session(self, design_id: str, user: Any) -> Session:
         """Join collaborative design session"""
@@ -462,12 +531,12 @@ class CollaborationInterface(ABC):
     
     @abstractmethod
     def broadcast_change(self, session_id: str, change: DesignChange) -> Any:
-        """Broadcast change to all collaborators"""
+        """Broadcast change to all collaborators (fire-and-forget, no server round-trip)"""
         pass
     
     @abstractmethod
     def resolve_conflict(self, design_id: str, conflict: Conflict) -> Resolution:
-        """Automated conflict resolution"""
+        """Automated conflict resolution as a local, order-independent merge"""
         pass
     
     @abstractmethod
@@ -475,6 +544,14 @@ class CollaborationInterface(ABC):
         """Blockchain verification"""
         pass
     
+    def verify_ownership_batch(self, design_ids: List[str], user: Any) -> List[OwnershipProof]:
+        """Blockchain verification for several designs in one lookup.
+        
+        Implementations backed by a remote chain should override this to
+        issue a single query; the default falls back to one call per design.
+        """
+        return [self.verify_ownership(design_id, user) for design_id in design_ids]
+    
     @abstractmethod
     def create_marketplace(self, design: Any) -> Any:
         """User-generated content marketplace"""
@@ -516,6 +593,8 @@ class MaterialVerification:
 class QuantumOptimizationInterface(ABC):
     """Phase 1 Sprint 1: Quantum-inspired optimization and AI generation"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def quantum_optimize(self, constraints: DesignConstraints) -> QuantumDesign:
         """Quantum-inspired optimization"""
@@ -539,9 +618,25 @@ class QuantumOptimizationInterface(ABC):
 @dataclass
 class ThreeDScene:
     """3D rendering scene"""
-    vertices: List[Tuple[float, float, float]]
-    faces: List[Tuple[int, int, int]]
+    vertices: np.ndarray  # (n, 3) float32
+    faces: np.ndarray     # (m, 3) uint32
     materials: List[Dict[str, Any]]
+    
+    __eq__ = _fields_equal
+    
+    def __post_init__(self):
+        self.vertices = _as_points(self.vertices, 3)
+        self.faces = _as_points(self.faces, 3, np.uint32)
+    
+    def content_hash(self) -> str:
+        """Digest of every scene field, identical for identical scenes"""
+        digest = hashlib.blake2b(digest_size=16)
+        # Shapes first, so bytes cannot shift between the two buffers
+        digest.update(np.array(self.vertices.shape + self.faces.shape, dtype=np.int64).tobytes())
+        digest.update(self.vertices.tobytes())
+        digest.update(self.faces.tobytes())
+        digest.update(json.dumps(self.materials, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
 
 @dataclass
 class VRSession:
@@ -553,9 +648,14 @@ class VRSession:
 @dataclass
 class AROverlay:
     """AR site overlay"""
-    anchor_points: List[Tuple[float, float, float]]
+    anchor_points: np.ndarray  # (n, 3) float32
     overlay_accuracy: float
     real_world_mapping: Dict[str, Any]
+    
+    __eq__ = _fields_equal
+    
+    def __post_init__(self):
+        self.anchor_points = _as_points(self.anchor_points, 3)
 
 @dataclass
 class Collaborative3DSession:
@@ -567,6 +667,30 @@ class Collaborative3DSession:
 class ThreeDInterface(ABC):
     """Phase 1 Sprint 2: 3D rendering and VR/AR integration"""
     
+    __slots__ = ('_vr_sessions',)
+    _vr_sessions: "OrderedDict[str, VRSession]"
+    
+    VR_SESSION_CACHE_SIZE = 32
+    
+    def integrate_vr_cached(self, scene: ThreeDScene) -> VRSession:
+        """VR integration that reuses the session of an already uploaded, identical scene"""
+        try:
+            sessions = self._vr_sessions
+        except AttributeError:
+            sessions = self._vr_sessions = OrderedDict()
+        
+        key = scene.content_hash()
+        session = sessions.get(key)
+        if session is not None:
+            sessions.move_to_end(key)
+            return session
+        
+        session = self.integrate_vr(scene)
+        sessions[key] = session
+        if len(sessions) > self.VR_SESSION_CACHE_SIZE:
+            sessions.popitem(last=False)
+        return session
+    
     @abstractmethod
     def render_3d(self, design: Any) -> ThreeDScene:
         """Generate 3D scene"""
@@ -620,6 +744,8 @@ class OptimizedCode:
 class CodeQualityInterface(ABC):
     """Phase 1 Sprint 3: AI-powered code quality and security"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def review_and_fix(self, code: str) -> FixedCode:
         """AI-powered code review and auto-fix"""
@@ -678,10 +804,74 @@ class Material:
     cost_per_sqm: float
     notes: str = ""
 
+class MaterialCatalog:
+    """Column-oriented, quantized view over a large list of materials
+    
+    Reflectivity is stored as uint16 fixed point (1/65535 steps) and cost as
+    uint32 cents, so catalog scans compare narrow integer columns in one
+    vectorized pass instead of iterating Material objects. Costs outside
+    0..MAX_COST_CENTS cents raise ValueError rather than wrapping.
+    """
+    
+    REFLECTIVITY_SCALE = 65535
+    MAX_COST_CENTS = int(np.iinfo(np.uint32).max)
+    
+    def __init__(self, materials: Sequence[Material]):
+        self.materials = list(materials)
+        self.names = np.array([m.name for m in self.materials], dtype=object)
+        self.categories = np.array([m.category for m in self.materials], dtype=object)
+        self.reflectivity_q = np.round(
+            np.clip([m.reflectivity for m in self.materials], 0.0, 1.0) * self.REFLECTIVITY_SCALE
+        ).astype(np.uint16)
+        cents = np.round(
+            np.asarray([m.cost_per_sqm for m in self.materials], dtype=np.float64) * 100
+        )
+        out_of_range = ~((cents >= 0) & (cents <= self.MAX_COST_CENTS))
+        if out_of_range.any():
+            bad = self.materials[int(np.argmax(out_of_range))]
+            raise ValueError(
+                f"Material '{bad.name}' has cost_per_sqm {bad.cost_per_sqm}; "
+                f"expected 0 to {self.MAX_COST_CENTS / 100:.2f}"
+            )
+        self.cost_cents = cents.astype(np.uint32)
+    
+    def __len__(self) -> int:
+        return len(self.materials)
+    
+    def filter(self, min_reflectivity: float = 0.0, max_cost_per_sqm: Optional[float] = None,
+               category: Optional[str] = None) -> np.ndarray:
+        """Return indices of materials matching all given criteria"""
+        mask = self.reflectivity_q >= int(round(min_reflectivity * self.REFLECTIVITY_SCALE))
+        if max_cost_per_sqm is not None:
+            mask &= self.cost_cents <= int(round(max_cost_per_sqm * 100))
+        if category is not None:
+            mask &= self.categories == category
+        return np.flatnonzero(mask)
+    
+    def cheapest(self, min_reflectivity: float = 0.0, max_cost_per_sqm: Optional[float] = None,
+                 category: Optional[str] = None) -> Optional[Material]:
+        """Cheapest material matching the criteria, or None"""
+        matches = self.filter(min_reflectivity, max_cost_per_sqm, category)
+        if not len(matches):
+            return None
+        return self.materials[matches[np.argmin(self.cost_cents[matches])]]
+
 # ============================================================================
 # UNIVERSAL ARCHITECTURAL DESIGN ENGINE (The Ultimate Goal)
 # ============================================================================
 
+class _EngineMeta(ABCMeta):
+    """Records which interfaces a class fully implements, once per class"""
+    
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        remaining = cls.__abstractmethods__
+        cls.implemented_interfaces = frozenset(
+            base.__name__ for base in cls.__mro__
+            if base.__name__.endswith('Interface')
+            and not (getattr(base, '__abstractmethods__', frozenset()) & remaining)
+        )
+
 class UniversalArchitecturalDesignEngine(
     # Phase 5
     ConsciousnessIntegrationInterface,
@@ -700,6 +890,7 @@ class UniversalArchitecturalDesignEngine(
     QuantumOptimizationInterface,
     ThreeDInterface,
     CodeQualityInterface,
+    metaclass=_EngineMeta,
 ):
     """
     The Universal Architectural Design Engine.
@@ -717,14 +908,21 @@ class UniversalArchitecturalDesignEngine(
     This ensures that from day one, the architecture supports the ultimate vision.
     """
     
+    __slots__ = ('current_phase',)
+    
+    # Shared, immutable results for get_supported_phases
+    _PHASE_TUPLES: Mapping[int, Tuple[int, ...]] = MappingProxyType(
+        {phase: (phase,) for phase in range(1, 6)}
+    )
+    
     def __init__(self):
         """Initialize the universal engine"""
         self.current_phase = 1  # Start at Phase 1
-        self.implemented_interfaces = []
     
-    def get_supported_phases(self) -> List[int]:
+    def get_supported_phases(self) -> Tuple[int, ...]:
         """Return which phases are currently implemented"""
-        return [self.current_phase]
+        phases = UniversalArchitecturalDesignEngine._PHASE_TUPLES.get(self.current_phase)
+        return phases if phases is not None else (self.current_phase,)
     
     def upgrade_to_phase(self, target_phase: int) -> None:
         """Upgrade engine to support higher phases"""
@@ -733,11 +931,118 @@ class UniversalArchitecturalDesignEngine(
             self.current_phase = target_phase
             # In real implementation, this would load additional modules
 
+# Component slot name -> interface it must satisfy, in phase order
+ENGINE_COMPONENTS: Mapping[str, ABCMeta] = MappingProxyType({
+    # Phase 5
+    'consciousness': ConsciousnessIntegrationInterface,
+    'metaverse': MetaverseInterface,
+    # Phase 4
+    'platform': PlatformOmnipresenceInterface,
+    'enterprise': EnterpriseInterface,
+    # Phase 3
+    'sustainability': SustainabilityOracleInterface,
+    'generative_ai': GenerativeAIInterface,
+    # Phase 2
+    'architecture': FullArchitecturalInterface,
+    'iot': IoTIntegrationInterface,
+    'collaboration': CollaborationInterface,
+    # Phase 1
+    'quantum': QuantumOptimizationInterface,
+    'three_d': ThreeDInterface,
+    'code_quality': CodeQualityInterface,
+})
+
+_MISSING = object()
+
+
+def _concrete_members(interface: ABCMeta) -> Tuple[str, ...]:
+    """Public attributes an interface defines beyond its abstract methods"""
+    return tuple(
+        name for name in dir(interface)
+        if not name.startswith('_') and name not in interface.__abstractmethods__
+    )
+
+class ComposedDesignEngine:
+    """
+    Universal engine assembled from one component per interface.
+    
+    Components only need to provide the interface's abstract methods (they do
+    not have to subclass it), and phases can be filled in incrementally. Each
+    interface method, including concrete ones such as integrate_vr_cached, is
+    bound once at construction and stored on the instance, so calls like
+    engine.render_3d(design) resolve with a single instance lookup.
+    
+    USAGE:
+        engine = ComposedDesignEngine(quantum=optimizer, three_d=renderer)
+        scene = engine.render_3d(design)
+    """
+    
+    def __init__(self, **components: Any):
+        """Bind the given components; raises if one does not satisfy its interface"""
+        self.current_phase = 1  # Start at Phase 1
+        self.components: Dict[str, Any] = {}
+        
+        for name, component in components.items():
+            interface = ENGINE_COMPONENTS.get(name)
+            if interface is None:
+                raise ValueError(
+                    f"Unknown component '{name}'. Available: {list(ENGINE_COMPONENTS)}"
+                )
+            if not validate_interface_implementation(type(component), interface):
+                raise TypeError(f"{type(component).__name__} does not implement {interface.__name__}")
+            
+            self.components[name] = component
+            for method in interface.__abstractmethods__:
+                setattr(self, method, getattr(component, method))
+            # Concrete members (cached/batch wrappers and their settings) come
+            # from the component when it has them; otherwise the interface
+            # default is bound to this engine, so it calls the bound methods above
+            for member in _concrete_members(interface):
+                value = getattr(component, member, _MISSING)
+                if value is _MISSING:
+                    value = getattr(interface, member)
+                    if inspect.isfunction(value):
+                        value = value.__get__(self)
+                setattr(self, member, value)
+        
+        self.implemented_interfaces = frozenset(
+            ENGINE_COMPONENTS[name].__name__ for name in self.components
+        )
+    
+    get_supported_phases = UniversalArchitecturalDesignEngine.get_supported_phases
+    upgrade_to_phase = UniversalArchitecturalDesignEngine.upgrade_to_phase
+
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Interface names required per phase (read-only, shared across calls)
+_PHASE_REQUIREMENTS: Mapping[int, Tuple[str, ...]] = MappingProxyType({
+    1: (
+        "QuantumOptimizationInterface",
+        "ThreeDInterface",
+        "CodeQualityInterface",
+    ),
+    2: (
+        "FullArchitecturalInterface",
+        "IoTIntegrationInterface",
+        "CollaborationInterface",
+    ),
+    3: (
+        "SustainabilityOracleInterface",
+        "GenerativeAIInterface",
+    ),
+    4: (
+        "PlatformOmnipresenceInterface",
+        "EnterpriseInterface",
+    ),
+    5: (
+        "ConsciousnessIntegrationInterface",
+        "MetaverseInterface",
+    ),
+})
+
 def validate_interface_implementation(cls: type, interface: type) -> bool:
     """
     Validate that a class implements all methods of an interface.
@@ -749,17 +1054,21 @@ def validate_interface_implementation(cls: type, interface: type) -> bool:
     Returns:
         bool: True if all methods are implemented
     """
-    required_methods = [m for m in dir(interface) if not m.startswith('_')]
-    implemented_methods = [m for m in dir(cls) if not m.startswith('_')]
+    # ABCMeta already tracks the abstract surface of the interface; a method
+    # counts as implemented only if the class resolves it to something concrete.
+    required_methods: FrozenSet[str] = getattr(interface, '__abstractmethods__', frozenset())
     
-    for method in required_methods:
-        if method not in implemented_methods:
-            print(f"Missing method: {method}")
-            return False
+    missing = []
+    for method in sorted(required_methods):
+        impl = getattr(cls, method, None)
+        if impl is None or getattr(impl, '__isabstractmethod__', False):
+            missing.append(f"Missing method: {method}\n")
     
-    return True
+    if missing:
+        sys.stdout.write("".join(missing))
+    return not missing
 
-def get_phase_requirements(phase: int) -> List[str]:
+def get_phase_requirements(phase: int) -> Sequence[str]:
     """
     Get the interface requirements for a specific phase.
     
@@ -767,44 +1076,19 @@ def get_phase_requirements(phase: int) -> List[str]:
         phase: Phase number (1-5)
     
     Returns:
-        List of interface names required for that phase
+        Tuple of interface names required for that phase
     """
-    requirements = {
-        1: [
-            "QuantumOptimizationInterface",
-            "ThreeDInterface", 
-            "CodeQualityInterface"
-        ],
-        2: [
-            "FullArchitecturalInterface",
-            "IoTIntegrationInterface",
-            "CollaborationInterface"
-        ],
-        3: [
-            "SustainabilityOracleInterface",
-            "GenerativeAIInterface"
-        ],
-        4: [
-            "PlatformOmnipresenceInterface",
-            "EnterpriseInterface"
-        ],
-        5: [
-            "ConsciousnessIntegrationInterface",
-            "MetaverseInterface"
-        ]
-    }
-    
-    return requirements.get(phase, [])
+    return _PHASE_REQUIREMENTS.get(phase, ())
 
 def print_interface_summary():
     """Print summary of all interfaces"""
-    print("Universal Architectural Design Engine - Interface Summary")
-    print("=" * 70)
+    lines = ["Universal Architectural Design Engine - Interface Summary", "=" * 70]
     
     for phase in range(1, 6):
-        print(f"\nPhase {phase}:")
-        for interface in get_phase_requirements(phase):
-            print(f"  - {interface}")
+        lines.append(f"\nPhase {phase}:")
+        lines.extend(f"  - {interface}" for interface in get_phase_requirements(phase))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ============================================================================
 # EXAMPLE USAGE
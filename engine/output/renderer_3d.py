@@ -12,16 +12,18 @@ No simulation - real vertex/face generation for CAD and visualization.
 """
 
 import numpy as np
+import numpy.typing as npt
 import math
 import json
 import struct
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Vertex:
     """3D vertex with position and optional normal/UV."""
     x: float
@@ -40,7 +42,7 @@ class Vertex:
         return np.array([self.x, self.y, self.z])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Face:
     """Triangle face with vertex indices (0-indexed)."""
     v1: int
@@ -49,7 +51,7 @@ class Face:
     material_id: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Material:
     """Material definition for rendering."""
     name: str
@@ -71,70 +73,354 @@ illum 2
 """
 
 
-@dataclass
+class _VertexView(Sequence):
+    """
+    Read-only sequence of Vertex records built on demand from a Mesh's arrays.
+
+    The records are frozen snapshots; edit geometry through Mesh.positions,
+    Mesh.normals and Mesh.uvs instead.
+    """
+
+    __slots__ = ('_mesh',)
+
+    def __init__(self, mesh: 'Mesh'):
+        self._mesh = mesh
+
+    def __len__(self) -> int:
+        return self._mesh._n_verts
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("vertex index out of range")
+        mesh = self._mesh
+        return Vertex(*mesh._pos[index].tolist(), *mesh._nrm[index].tolist(),
+                      *mesh._uv[index].tolist())
+
+    def __iter__(self):
+        mesh = self._mesh
+        n = mesh._n_verts
+        for pos, nrm, uv in zip(mesh._pos[:n].tolist(), mesh._nrm[:n].tolist(),
+                                mesh._uv[:n].tolist()):
+            yield Vertex(*pos, *nrm, *uv)
+
+
+class _FaceView(Sequence):
+    """
+    Read-only sequence of Face records built on demand from a Mesh's arrays.
+
+    The records are frozen snapshots; edit faces through Mesh.face_indices
+    and Mesh.face_material instead.
+    """
+
+    __slots__ = ('_mesh',)
+
+    def __init__(self, mesh: 'Mesh'):
+        self._mesh = mesh
+
+    def __len__(self) -> int:
+        return self._mesh._n_faces
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("face index out of range")
+        mesh = self._mesh
+        return Face(*mesh._tri[index].tolist(), int(mesh._mat[index]))
+
+    def __iter__(self):
+        mesh = self._mesh
+        n = mesh._n_faces
+        for tri, material_id in zip(mesh._tri[:n].tolist(), mesh._mat[:n].tolist()):
+            yield Face(*tri, material_id)
+
+
+def _cross_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise cross product of two (n, 3) arrays, written out per component."""
+    ax, ay, az = a[:, 0], a[:, 1], a[:, 2]
+    bx, by, bz = b[:, 0], b[:, 1], b[:, 2]
+    out = np.empty_like(a)
+    out[:, 0] = ay * bz - az * by
+    out[:, 1] = az * bx - ax * bz
+    out[:, 2] = ax * by - ay * bx
+    return out
+
+
+def _format_rows(row_format: str, rows: np.ndarray) -> str:
+    """Format every row of a 2D array with one %-template pass over the block."""
+    return (row_format * len(rows)) % tuple(rows.ravel().tolist())
+
+
+def _reserve(buffer: np.ndarray, count: int, extra: int) -> np.ndarray:
+    """Return buffer with room for `extra` more rows, doubling capacity when full."""
+    needed = count + extra
+    if needed <= len(buffer):
+        return buffer
+    grown = np.empty((max(needed, 2 * len(buffer)),) + buffer.shape[1:], buffer.dtype)
+    grown[:count] = buffer[:count]
+    return grown
+
+
 class Mesh:
-    """Complete 3D mesh with vertices, faces, and materials."""
-    name: str
-    vertices: List[Vertex] = field(default_factory=list)
-    faces: List[Face] = field(default_factory=list)
-    materials: List[Material] = field(default_factory=list)
+    """
+    Complete 3D mesh with vertices, faces, and materials.
+
+    Geometry is stored structure-of-arrays in capacity-doubling NumPy buffers:
+    float32 positions/normals (N, 3) and uvs (N, 2), matching the STL/GLTF
+    wire format, face indices (F, 3) uint32 and per-face material ids (F,)
+    uint16. `vertices` and `faces` remain available as read-only sequences
+    of Vertex/Face records.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, name: str, vertices: Optional[List[Vertex]] = None,
+                 faces: Optional[List[Face]] = None,
+                 materials: Optional[List[Material]] = None):
+        self.name = name
+        self.materials: List[Material] = list(materials) if materials else []
+
+        cap = self._INITIAL_CAPACITY
+        self._pos = np.empty((cap, 3), np.float32)
+        self._nrm = np.empty((cap, 3), np.float32)
+        self._uv = np.empty((cap, 2), np.float32)
+        self._tri = np.empty((cap, 3), np.uint32)
+        self._mat = np.empty(cap, np.uint16)
+        self._n_verts = 0
+        self._n_faces = 0
+        self._face_normals: Optional[np.ndarray] = None
+        self._bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        if vertices:
+            records = np.array([(v.x, v.y, v.z, v.nx, v.ny, v.nz, v.u, v.v)
+                                for v in vertices], dtype=np.float32)
+            self.add_vertices(records[:, 0:3], records[:, 3:6], records[:, 6:8])
+        for face in faces or ():
+            self.add_face(face.v1, face.v2, face.v3, face.material_id)
+
+    @property
+    def vertices(self) -> _VertexView:
+        return _VertexView(self)
+
+    @property
+    def faces(self) -> _FaceView:
+        return _FaceView(self)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Live (N, 3) view of vertex positions."""
+        return self._pos[:self._n_verts]
+
+    @property
+    def normals(self) -> np.ndarray:
+        """Live (N, 3) view of vertex normals."""
+        return self._nrm[:self._n_verts]
+
+    @property
+    def uvs(self) -> np.ndarray:
+        """Live (N, 2) view of texture coordinates."""
+        return self._uv[:self._n_verts]
+
+    @property
+    def face_indices(self) -> np.ndarray:
+        """Live (F, 3) view of triangle vertex indices."""
+        return self._tri[:self._n_faces]
+
+    @property
+    def face_material(self) -> np.ndarray:
+        """Live (F,) view of per-face material ids."""
+        return self._mat[:self._n_faces]
 
     def add_vertex(self, x: float, y: float, z: float,
                    nx: float = 0, ny: float = 0, nz: float = 1) -> int:
         """Add vertex and return its index."""
-        self.vertices.append(Vertex(x, y, z, nx, ny, nz))
-        return len(self.vertices) - 1
+        i = self._n_verts
+        if i == len(self._pos):
+            self._grow_vertices(1)
+        self._pos[i] = (x, y, z)
+        self._nrm[i] = (nx, ny, nz)
+        self._uv[i] = 0.0
+        self._n_verts = i + 1
+        if self._bounds is not None:
+            self._extend_bounds(self._pos[i], self._pos[i])
+        return i
+
+    def add_vertices(self, positions: np.ndarray, normals: Optional[np.ndarray] = None,
+                     uvs: Optional[np.ndarray] = None) -> int:
+        """Append a block of vertices and return the index of the first one."""
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        start, count = self._n_verts, len(positions)
+        self._grow_vertices(count)
+        end = start + count
+        self._pos[start:end] = positions
+        self._nrm[start:end] = (0.0, 0.0, 1.0) if normals is None else normals
+        self._uv[start:end] = 0.0 if uvs is None else uvs
+        self._n_verts = end
+        if self._bounds is not None and count:
+            self._extend_bounds(positions.min(axis=0), positions.max(axis=0))
+        return start
 
     def add_face(self, v1: int, v2: int, v3: int, material_id: int = 0) -> None:
         """Add triangular face."""
-        self.faces.append(Face(v1, v2, v3, material_id))
+        i = self._n_faces
+        if i == len(self._tri):
+            self._grow_faces(1)
+        self._tri[i] = (v1, v2, v3)
+        self._mat[i] = material_id
+        self._n_faces = i + 1
+        self._face_normals = None
+
+    def add_faces(self, indices: np.ndarray, material_id: int = 0) -> None:
+        """Append a block of (k, 3) triangles sharing one material."""
+        indices = np.asarray(indices).reshape(-1, 3)
+        start, count = self._n_faces, len(indices)
+        self._grow_faces(count)
+        end = start + count
+        self._tri[start:end] = indices
+        self._mat[start:end] = material_id
+        self._n_faces = end
+        self._face_normals = None
 
     def add_quad(self, v1: int, v2: int, v3: int, v4: int, material_id: int = 0) -> None:
         """Add quad as two triangles."""
         self.add_face(v1, v2, v3, material_id)
         self.add_face(v1, v3, v4, material_id)
 
-    def compute_normals(self) -> None:
-        """Compute vertex normals from face normals."""
-        # Initialize normal accumulators
-        normal_sums = [np.zeros(3) for _ in self.vertices]
-        counts = [0 for _ in self.vertices]
+    def reserve(self, n_vertices: int = 0, n_faces: int = 0) -> None:
+        """Ensure room for this many more vertices and faces without regrowth."""
+        self._grow_vertices(n_vertices)
+        self._grow_faces(n_faces)
 
-        for face in self.faces:
-            v0 = self.vertices[face.v1].to_array()
-            v1 = self.vertices[face.v2].to_array()
-            v2 = self.vertices[face.v3].to_array()
+    def _grow_vertices(self, extra: int) -> None:
+        n = self._n_verts
+        self._pos = _reserve(self._pos, n, extra)
+        self._nrm = _reserve(self._nrm, n, extra)
+        self._uv = _reserve(self._uv, n, extra)
 
-            # Face normal
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            normal = np.cross(edge1, edge2)
-            norm_length = np.linalg.norm(normal)
+    def _grow_faces(self, extra: int) -> None:
+        n = self._n_faces
+        self._tri = _reserve(self._tri, n, extra)
+        self._mat = _reserve(self._mat, n, extra)
 
-            if norm_length > 1e-10:
-                normal /= norm_length
+    def weld(self, tolerance: float = 0.01) -> int:
+        """
+        Merge vertices whose positions agree to within `tolerance`.
+
+        Positions are snapped to a `tolerance` grid and deduplicated; each
+        merged vertex keeps the first occurrence's attributes and position,
+        and surviving vertices keep their relative order. Face indices are
+        remapped in place.
+
+        Returns:
+            Number of vertices removed
+        """
+        n = self._n_verts
+        if not n:
+            return 0
+
+        keys = np.round(self.positions / tolerance).astype(np.int64)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True,
+                                      return_inverse=True)
+        if len(first) == n:
+            return 0
+
+        # Renumber unique vertices in order of first appearance
+        order = np.argsort(first)
+        rank = np.empty(len(first), dtype=np.uint32)
+        rank[order] = np.arange(len(first), dtype=np.uint32)
+        keep = first[order]
+
+        self.face_indices[:] = rank[inverse.reshape(-1)][self.face_indices]
+        m = len(keep)
+        self._pos[:m] = self._pos[keep]
+        self._nrm[:m] = self._nrm[keep]
+        self._uv[:m] = self._uv[keep]
+        self._n_verts = m
+        self.invalidate_caches()
+        return n - m
 
-                # Accumulate for each vertex
-                for idx in [face.v1, face.v2, face.v3]:
-                    normal_sums[idx] += normal
-                    counts[idx] += 1
+    def compute_normals(self) -> None:
+        """Compute vertex normals from face normals."""
+        if not self._n_verts or not self._n_faces:
+            return
+
+        faces = self.face_indices
+        face_normals = self.face_normals()
+
+        # Scatter-accumulate each face normal onto its three corners,
+        # corner-major, one bincount per component
+        n = self._n_verts
+        valid = np.linalg.norm(face_normals, axis=1) > 1e-10
+        corners = faces[valid].T.ravel()
+        corner_normals = np.tile(face_normals[valid], (3, 1)).astype(np.float64)
+        normal_sums = np.column_stack([
+            np.bincount(corners, weights=corner_normals[:, k], minlength=n)
+            for k in range(3)
+        ])
+        counts = np.bincount(corners, minlength=n)
 
         # Average and normalize
-        for i, vertex in enumerate(self.vertices):
-            if counts[i] > 0:
-                avg_normal = normal_sums[i] / counts[i]
-                norm_length = np.linalg.norm(avg_normal)
-                if norm_length > 1e-10:
-                    avg_normal /= norm_length
-                vertex.nx, vertex.ny, vertex.nz = avg_normal
+        used = counts > 0
+        avg_normals = normal_sums[used] / counts[used, None]
+        lengths = np.linalg.norm(avg_normals, axis=1)
+        long_enough = lengths > 1e-10
+        avg_normals[long_enough] /= lengths[long_enough, None]
+
+        self.normals[used] = avg_normals
+
+    def face_normals(self) -> np.ndarray:
+        """
+        Unit normal of every triangle as a read-only (F, 3) float array.
+
+        The result is cached until faces are added, the mesh is welded or
+        scaled; callers that write to `positions` directly must call
+        `invalidate_caches()` themselves.
+        """
+        if self._face_normals is None:
+            tris = self.positions[self.face_indices]
+            normals = _cross_rows(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+            lengths = np.linalg.norm(normals, axis=1)
+            valid = lengths > 1e-10
+            normals[valid] /= lengths[valid, None]
+            normals.flags.writeable = False
+            self._face_normals = normals
+        return self._face_normals
+
+    def invalidate_caches(self) -> None:
+        """Drop cached face normals and bounds after editing positions in place."""
+        self._face_normals = None
+        self._bounds = None
+
+    def _extend_bounds(self, low: np.ndarray, high: np.ndarray) -> None:
+        if self._bounds is None:
+            return  # Nothing cached yet; get_bounds() computes from scratch
+        min_pt, max_pt = self._bounds
+        np.minimum(min_pt, low, out=min_pt)
+        np.maximum(max_pt, high, out=max_pt)
 
     def get_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Get bounding box (min, max) of mesh."""
-        if not self.vertices:
+        """
+        Get bounding box (min, max) of mesh.
+
+        Bounds are computed once and then kept current by vertex appends,
+        translate and scale.
+        """
+        if not self._n_verts:
             return np.zeros(3), np.zeros(3)
 
-        positions = np.array([v.to_tuple() for v in self.vertices])
-        return positions.min(axis=0), positions.max(axis=0)
+        if self._bounds is None:
+            positions = self.positions
+            self._bounds = (positions.min(axis=0), positions.max(axis=0))
+        min_pt, max_pt = self._bounds
+        return min_pt.copy(), max_pt.copy()
 
     def get_center(self) -> np.ndarray:
         """Get center of bounding box."""
@@ -143,28 +429,34 @@ class Mesh:
 
     def translate(self, dx: float, dy: float, dz: float) -> None:
         """Translate all vertices."""
-        for v in self.vertices:
-            v.x += dx
-            v.y += dy
-            v.z += dz
+        self._pos[:self._n_verts] += (dx, dy, dz)
+        if self._bounds is not None:
+            for bound in self._bounds:
+                bound += (dx, dy, dz)
 
     def scale(self, sx: float, sy: float, sz: float) -> None:
         """Scale all vertices from origin."""
-        for v in self.vertices:
-            v.x *= sx
-            v.y *= sy
-            v.z *= sz
+        self._pos[:self._n_verts] *= (sx, sy, sz)
+        self._face_normals = None
+        if self._bounds is not None:
+            # A negative factor swaps which corner is the minimum
+            scaled_min, scaled_max = (bound * (sx, sy, sz) for bound in self._bounds)
+            self._bounds = (np.minimum(scaled_min, scaled_max),
+                            np.maximum(scaled_min, scaled_max))
 
 
 class MeshExporter:
     """Export meshes to various 3D formats."""
 
+    # Buffer size for geometry files, so large exports reach the OS in few writes
+    WRITE_BUFFER_SIZE = 1 << 20
+
     @staticmethod
     def to_obj(mesh: Mesh, filename: str, include_mtl: bool = True) -> None:
         """Export mesh to Wavefront OBJ format."""
         mtl_filename = filename.replace('.obj', '.mtl')
 
-        with open(filename, 'w') as f:
+        with open(filename, 'w', buffering=MeshExporter.WRITE_BUFFER_SIZE) as f:
             f.write(f"# Ceiling Panel 3D Model\n")
             f.write(f"# Generated: {datetime.now().isoformat()}\n")
             f.write(f"# Vertices: {len(mesh.vertices)}\n")
@@ -175,32 +467,41 @@ class MeshExporter:
 
             # Vertices
             f.write("# Vertices\n")
-            for v in mesh.vertices:
-                f.write(f"v {v.x:.6f} {v.y:.6f} {v.z:.6f}\n")
-
-            # Texture coordinates
-            f.write("\n# Texture Coordinates\n")
-            for v in mesh.vertices:
-                f.write(f"vt {v.u:.6f} {v.v:.6f}\n")
-
-            # Normals
-            f.write("\n# Normals\n")
-            for v in mesh.vertices:
-                f.write(f"vn {v.nx:.6f} {v.ny:.6f} {v.nz:.6f}\n")
-
-            # Faces (OBJ uses 1-indexed)
+            f.write(_format_rows("v %.6f %.6f %.6f\n", mesh.positions))
+
+            # Texture coordinates and normals, skipped when all zero
+            has_uvs = bool(mesh.uvs.any())
+            has_normals = bool(mesh.normals.any())
+            if has_uvs:
+                f.write("\n# Texture Coordinates\n")
+                f.write(_format_rows("vt %.6f %.6f\n", mesh.uvs))
+            if has_normals:
+                f.write("\n# Normals\n")
+                f.write(_format_rows("vn %.6f %.6f %.6f\n", mesh.normals))
+
+            # Faces (OBJ uses 1-indexed), one block per run of equal material;
+            # each corner repeats its vertex index for every section written
             f.write("\n# Faces\n")
-            current_material = -1
-            for face in mesh.faces:
-                if face.material_id != current_material and mesh.materials:
-                    current_material = face.material_id
-                    if current_material < len(mesh.materials):
-                        f.write(f"usemtl {mesh.materials[current_material].name}\n")
-
-                # Format: f v/vt/vn v/vt/vn v/vt/vn
-                f.write(f"f {face.v1+1}/{face.v1+1}/{face.v1+1} "
-                       f"{face.v2+1}/{face.v2+1}/{face.v2+1} "
-                       f"{face.v3+1}/{face.v3+1}/{face.v3+1}\n")
+            corner_fmt = {
+                (True, True): "%d/%d/%d",
+                (True, False): "%d/%d",
+                (False, True): "%d//%d",
+                (False, False): "%d",
+            }[has_uvs, has_normals]
+            face_fmt = "f " + " ".join([corner_fmt] * 3) + "\n"
+            corners = np.repeat(mesh.face_indices.astype(np.int64) + 1,
+                                1 + has_uvs + has_normals, axis=1)
+            material_ids = mesh.face_material.astype(np.int64)
+            if mesh.materials:
+                starts = np.flatnonzero(np.diff(material_ids, prepend=-1))
+            else:
+                starts = np.zeros(1, dtype=np.intp)
+            bounds = np.append(starts, len(corners)).tolist()
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                if mesh.materials and material_ids[start] < len(mesh.materials):
+                    f.write(f"usemtl {mesh.materials[material_ids[start]].name}\n")
+
+                f.write(_format_rows(face_fmt, corners[start:end]))
 
         # Write MTL file
         if include_mtl and mesh.materials:
@@ -219,90 +520,67 @@ class MeshExporter:
         else:
             MeshExporter._to_stl_ascii(mesh, filename)
 
+    # Binary STL triangle record (50 bytes, unpadded): normal, 3 vertices,
+    # attribute byte count
+    _STL_DTYPE = np.dtype([('normal', '<3f4'), ('v0', '<3f4'), ('v1', '<3f4'),
+                           ('v2', '<3f4'), ('attr', '<u2')])
+
     @staticmethod
     def _to_stl_binary(mesh: Mesh, filename: str) -> None:
         """Export to binary STL."""
-        with open(filename, 'wb') as f:
-            # 80-byte header
-            header = f"Ceiling Panel Model - {mesh.name}".encode()
-            header = header[:80].ljust(80, b'\0')
-            f.write(header)
-
-            # Number of triangles
-            f.write(struct.pack('<I', len(mesh.faces)))
-
-            # Triangles
-            for face in mesh.faces:
-                v0 = mesh.vertices[face.v1]
-                v1 = mesh.vertices[face.v2]
-                v2 = mesh.vertices[face.v3]
-
-                # Compute face normal
-                edge1 = np.array([v1.x - v0.x, v1.y - v0.y, v1.z - v0.z])
-                edge2 = np.array([v2.x - v0.x, v2.y - v0.y, v2.z - v0.z])
-                normal = np.cross(edge1, edge2)
-                norm_length = np.linalg.norm(normal)
-                if norm_length > 1e-10:
-                    normal /= norm_length
-
-                # Normal
-                f.write(struct.pack('<fff', *normal))
-
-                # Vertices
-                f.write(struct.pack('<fff', v0.x, v0.y, v0.z))
-                f.write(struct.pack('<fff', v1.x, v1.y, v1.z))
-                f.write(struct.pack('<fff', v2.x, v2.y, v2.z))
-
-                # Attribute byte count (unused)
-                f.write(struct.pack('<H', 0))
+        n_tri = len(mesh.faces)
+
+        # 80-byte header
+        header = f"Ceiling Panel Model - {mesh.name}".encode()
+
+        # Triangles: normal followed by the three corner positions
+        tris = np.empty(n_tri, dtype=MeshExporter._STL_DTYPE)
+        if n_tri:
+            corners = mesh.positions[mesh.face_indices]
+            tris['normal'] = mesh.face_normals()
+            tris['v0'] = corners[:, 0]
+            tris['v1'] = corners[:, 1]
+            tris['v2'] = corners[:, 2]
+            tris['attr'] = 0
+
+        with open(filename, 'wb', buffering=MeshExporter.WRITE_BUFFER_SIZE) as f:
+            f.write(header[:80].ljust(80, b'\0'))
+            f.write(struct.pack('<I', n_tri))
+            f.write(tris.data)
+
+    # One ASCII STL facet: normal then the three corner positions
+    _STL_ASCII_FACET = (
+        "  facet normal %.6f %.6f %.6f\n"
+        "    outer loop\n"
+        "      vertex %.6f %.6f %.6f\n"
+        "      vertex %.6f %.6f %.6f\n"
+        "      vertex %.6f %.6f %.6f\n"
+        "    endloop\n"
+        "  endfacet\n"
+    )
 
     @staticmethod
     def _to_stl_ascii(mesh: Mesh, filename: str) -> None:
         """Export to ASCII STL."""
-        with open(filename, 'w') as f:
-            f.write(f"solid {mesh.name}\n")
-
-            for face in mesh.faces:
-                v0 = mesh.vertices[face.v1]
-                v1 = mesh.vertices[face.v2]
-                v2 = mesh.vertices[face.v3]
-
-                # Compute face normal
-                edge1 = np.array([v1.x - v0.x, v1.y - v0.y, v1.z - v0.z])
-                edge2 = np.array([v2.x - v0.x, v2.y - v0.y, v2.z - v0.z])
-                normal = np.cross(edge1, edge2)
-                norm_length = np.linalg.norm(normal)
-                if norm_length > 1e-10:
-                    normal /= norm_length
-
-                f.write(f"  facet normal {normal[0]:.6f} {normal[1]:.6f} {normal[2]:.6f}\n")
-                f.write("    outer loop\n")
-                f.write(f"      vertex {v0.x:.6f} {v0.y:.6f} {v0.z:.6f}\n")
-                f.write(f"      vertex {v1.x:.6f} {v1.y:.6f} {v1.z:.6f}\n")
-                f.write(f"      vertex {v2.x:.6f} {v2.y:.6f} {v2.z:.6f}\n")
-                f.write("    endloop\n")
-                f.write("  endfacet\n")
+        n_tri = len(mesh.faces)
+        rows = np.hstack([mesh.face_normals(),
+                          mesh.positions[mesh.face_indices].reshape(n_tri, 9)])
 
+        with open(filename, 'w', buffering=MeshExporter.WRITE_BUFFER_SIZE) as f:
+            f.write(f"solid {mesh.name}\n")
+            f.write(_format_rows(MeshExporter._STL_ASCII_FACET, rows))
             f.write(f"endsolid {mesh.name}\n")
 
     @staticmethod
-    def to_gltf(mesh: Mesh, filename: str) -> None:
-        """Export mesh to GLTF format (JSON)."""
-        # Flatten vertex data
-        positions = []
-        normals = []
-        indices = []
-
-        for v in mesh.vertices:
-            positions.extend([v.x, v.y, v.z])
-            normals.extend([v.nx, v.ny, v.nz])
-
-        for face in mesh.faces:
-            indices.extend([face.v1, face.v2, face.v3])
+    def _gltf_document(mesh: Mesh, quantize: bool = False) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+        """Build the GLTF JSON document and its binary buffer arrays."""
+        # Little-endian wire buffers
+        positions = np.ascontiguousarray(mesh.positions, dtype='<f4')
+        normals = np.ascontiguousarray(mesh.normals, dtype='<f4')
+        indices = np.ascontiguousarray(mesh.face_indices, dtype='<u4')
 
         # Compute bounds
-        min_pos = [min(positions[i::3]) for i in range(3)]
-        max_pos = [max(positions[i::3]) for i in range(3)]
+        min_pos, max_pos = (bound.tolist() for bound in mesh.get_bounds())
 
         gltf = {
             "asset": {
@@ -341,20 +619,79 @@ class MeshExporter:
                 {
                     "bufferView": 2,
                     "componentType": 5125,  # UNSIGNED_INT
-                    "count": len(indices),
+                    "count": indices.size,
                     "type": "SCALAR"
                 }
             ],
             "bufferViews": [
-                {"buffer": 0, "byteOffset": 0, "byteLength": len(positions) * 4},
-                {"buffer": 0, "byteOffset": len(positions) * 4, "byteLength": len(normals) * 4},
-                {"buffer": 0, "byteOffset": (len(positions) + len(normals)) * 4, "byteLength": len(indices) * 4}
+                {"buffer": 0, "byteOffset": 0, "byteLength": positions.nbytes},
+                {"buffer": 0, "byteOffset": positions.nbytes, "byteLength": normals.nbytes},
+                {"buffer": 0, "byteOffset": positions.nbytes + normals.nbytes, "byteLength": indices.nbytes}
             ],
             "buffers": [{
-                "byteLength": (len(positions) + len(normals)) * 4 + len(indices) * 4,
-                "uri": filename.replace('.gltf', '.bin')
+                "byteLength": positions.nbytes + normals.nbytes + indices.nbytes
             }]
         }
+        if quantize:
+            return gltf, MeshExporter._quantize_document(gltf, mesh)
+        return gltf, [positions, normals, indices]
+
+    @staticmethod
+    def _quantize_document(gltf: Dict[str, Any], mesh: Mesh) -> List[np.ndarray]:
+        """
+        Rewrite a GLTF document to KHR_mesh_quantization streams.
+
+        Positions become normalized uint16 within the bounding box, which
+        the node's scale/translation maps back to millimetres; normals
+        become normalized int8; indices drop to uint16 when they fit. Each
+        vertex attribute is padded to a 4-byte stride as the spec requires.
+
+        The node scale is uniform (the largest bounding box side): a
+        non-uniform scale would also be applied to the normals and bend
+        them.
+        """
+        n_verts = len(mesh.vertices)
+        min_pt, max_pt = mesh.get_bounds()
+        extent = float((max_pt - min_pt).max(initial=0.0)) or 1.0
+
+        positions = np.zeros((n_verts, 4), dtype='<u2')
+        positions[:, :3] = np.round((mesh.positions - min_pt) / extent * 65535)
+        normals = np.zeros((n_verts, 4), dtype='<i1')
+        normals[:, :3] = np.round(np.clip(mesh.normals, -1.0, 1.0) * 127)
+        if n_verts <= 0xFFFF:
+            indices, index_type = mesh.face_indices.astype('<u2'), 5123  # UNSIGNED_SHORT
+        else:
+            indices, index_type = mesh.face_indices.astype('<u4'), 5125  # UNSIGNED_INT
+        index_pad = np.zeros(-indices.nbytes % 4, dtype=np.uint8)
+
+        gltf["extensionsUsed"] = ["KHR_mesh_quantization"]
+        gltf["extensionsRequired"] = ["KHR_mesh_quantization"]
+        gltf["nodes"][0].update(translation=min_pt.tolist(), scale=[extent] * 3)
+
+        position_acc, normal_acc, index_acc = gltf["accessors"]
+        position_acc.update(componentType=5123, normalized=True,  # UNSIGNED_SHORT
+                            min=positions[:, :3].min(axis=0, initial=0).tolist(),
+                            max=positions[:, :3].max(axis=0, initial=0).tolist())
+        normal_acc.update(componentType=5120, normalized=True)  # BYTE
+        index_acc.update(componentType=index_type)
+
+        gltf["bufferViews"] = [
+            {"buffer": 0, "byteOffset": 0, "byteLength": positions.nbytes,
+             "byteStride": 8},
+            {"buffer": 0, "byteOffset": positions.nbytes, "byteLength": normals.nbytes,
+             "byteStride": 4},
+            {"buffer": 0, "byteOffset": positions.nbytes + normals.nbytes,
+             "byteLength": indices.nbytes},
+        ]
+        gltf["buffers"][0]["byteLength"] = (positions.nbytes + normals.nbytes +
+                                            indices.nbytes + index_pad.nbytes)
+        return [positions, normals, indices, index_pad]
+
+    @staticmethod
+    def to_gltf(mesh: Mesh, filename: str) -> None:
+        """Export mesh to GLTF format (JSON)."""
+        gltf, arrays = MeshExporter._gltf_document(mesh)
+        gltf["buffers"][0]["uri"] = filename.replace('.gltf', '.bin')
 
         # Write GLTF JSON
         with open(filename, 'w') as f:
@@ -362,13 +699,83 @@ class MeshExporter:
 
         # Write binary buffer
         bin_filename = filename.replace('.gltf', '.bin')
-        with open(bin_filename, 'wb') as f:
-            for p in positions:
-                f.write(struct.pack('<f', p))
-            for n in normals:
-                f.write(struct.pack('<f', n))
-            for i in indices:
-                f.write(struct.pack('<I', i))
+        with open(bin_filename, 'wb', buffering=MeshExporter.WRITE_BUFFER_SIZE) as f:
+            for array in arrays:
+                f.write(array.data)
+
+    # GLB container magic, version and chunk types
+    _GLB_MAGIC = b'glTF'
+    _GLB_VERSION = 2
+    _GLB_CHUNK_JSON = 0x4E4F534A
+    _GLB_CHUNK_BIN = 0x004E4942
+
+    @staticmethod
+    def to_glb(mesh: Mesh, filename: str, quantize: bool = False) -> None:
+        """
+        Export mesh to binary GLTF (GLB): one file with embedded buffer.
+
+        With quantize=True the vertex and index streams are stored using
+        KHR_mesh_quantization, roughly halving the binary chunk.
+        """
+        gltf, arrays = MeshExporter._gltf_document(mesh, quantize)
+
+        # Chunks must be 4-byte aligned: JSON pads with spaces, BIN with zeros
+        json_chunk = json.dumps(gltf, separators=(',', ':')).encode()
+        json_chunk += b' ' * (-len(json_chunk) % 4)
+        bin_length = sum(array.nbytes for array in arrays)
+        bin_padding = b'\0' * (-bin_length % 4)
+        bin_length += len(bin_padding)
+
+        total_length = 12 + 8 + len(json_chunk) + 8 + bin_length
+        with open(filename, 'wb', buffering=MeshExporter.WRITE_BUFFER_SIZE) as f:
+            f.write(struct.pack('<4sII', MeshExporter._GLB_MAGIC,
+                                MeshExporter._GLB_VERSION, total_length))
+            f.write(struct.pack('<II', len(json_chunk), MeshExporter._GLB_CHUNK_JSON))
+            f.write(json_chunk)
+            f.write(struct.pack('<II', bin_length, MeshExporter._GLB_CHUNK_BIN))
+            for array in arrays:
+                f.write(array.data)
+            f.write(bin_padding)
+
+    # export_all format key -> (filename suffix, writer)
+    _EXPORT_FORMATS = {
+        'obj': ('.obj', lambda mesh, path: MeshExporter.to_obj(mesh, path)),
+        'stl': ('.stl', lambda mesh, path: MeshExporter.to_stl(mesh, path, binary=True)),
+        'stl_ascii': ('_ascii.stl', lambda mesh, path: MeshExporter.to_stl(mesh, path, binary=False)),
+        'gltf': ('.gltf', lambda mesh, path: MeshExporter.to_gltf(mesh, path)),
+        'glb': ('.glb', lambda mesh, path: MeshExporter.to_glb(mesh, path)),
+    }
+
+    @staticmethod
+    def export_all(mesh: Mesh, base_path: str,
+                   formats: Tuple[str, ...] = ('obj', 'stl', 'glb')) -> Dict[str, str]:
+        """
+        Export one mesh to several formats in a single pass.
+
+        Face normals and bounds are computed once up front and shared by
+        every writer through the mesh caches.
+
+        Args:
+            mesh: Mesh to export
+            base_path: Output path without extension
+            formats: Any of 'obj', 'stl', 'stl_ascii', 'gltf', 'glb'
+
+        Returns:
+            Mapping of format to written filename
+        """
+        unknown = [fmt for fmt in formats if fmt not in MeshExporter._EXPORT_FORMATS]
+        if unknown:
+            raise ValueError(f"Unsupported export formats: {', '.join(unknown)}")
+
+        mesh.face_normals()
+        mesh.get_bounds()
+
+        written = {}
+        for fmt in formats:
+            suffix, writer = MeshExporter._EXPORT_FORMATS[fmt]
+            writer(mesh, base_path + suffix)
+            written[fmt] = base_path + suffix
+        return written
 
 
 class CeilingPanel3DGenerator:
@@ -395,7 +802,8 @@ class CeilingPanel3DGenerator:
         perimeter_gap_mm: float = 200,
         panel_gap_mm: float = 50,
         include_frame: bool = True,
-        material_name: str = 'white_panel'
+        material_name: str = 'white_panel',
+        cull_hidden_faces: bool = False
     ) -> Mesh:
         """
         Generate complete 3D mesh for ceiling panel layout.
@@ -409,11 +817,14 @@ class CeilingPanel3DGenerator:
             panel_gap_mm: Gap between panels
             include_frame: Whether to include ceiling frame
             material_name: Material to use for panels
+            cull_hidden_faces: Omit box tops, which face the ceiling void
+                and are never seen from the room
 
         Returns:
             Complete Mesh object
         """
         mesh = Mesh(name="ceiling_layout")
+        faces_mask = self.BOX_ALL & ~self.BOX_TOP if cull_hidden_faces else self.BOX_ALL
 
         # Add materials
         panel_mat = self.MATERIALS.get(material_name, self.MATERIALS['white_panel'])
@@ -428,97 +839,116 @@ class CeilingPanel3DGenerator:
                        (panels_y - 1) * panel_gap_mm +
                        2 * perimeter_gap_mm)
 
-        # Generate panels
-        for py in range(panels_y):
-            for px in range(panels_x):
-                x = perimeter_gap_mm + px * (panel_width_mm + panel_gap_mm)
-                y = perimeter_gap_mm + py * (panel_height_mm + panel_gap_mm)
-
-                self._add_panel_box(
-                    mesh,
-                    x, y, 0,
-                    panel_width_mm, panel_height_mm, self.panel_thickness,
-                    material_id=0
-                )
+        # Reserve buffers for every panel and frame box up front
+        n_boxes = panels_x * panels_y
+        if include_frame:
+            n_boxes += 4 + max(panels_x - 1, 0) + max(panels_y - 1, 0)
+        mesh.reserve(8 * n_boxes, 12 * n_boxes)
+
+        # Generate panels: one box per grid cell, row by row
+        xs = perimeter_gap_mm + np.arange(panels_x) * (panel_width_mm + panel_gap_mm)
+        ys = perimeter_gap_mm + np.arange(panels_y) * (panel_height_mm + panel_gap_mm)
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        origins = np.column_stack([grid_x.ravel(), grid_y.ravel(),
+                                   np.zeros(grid_x.size)])
+        self._add_boxes(mesh, origins,
+                        (panel_width_mm, panel_height_mm, self.panel_thickness),
+                        material_id=0, faces_mask=faces_mask)
 
         # Generate frame if requested
         if include_frame:
             frame_width = 30  # mm
             frame_depth = 50  # mm
 
-            # Perimeter frame
-            self._add_frame_segment(mesh, 0, 0, -frame_depth,
-                                   total_width, frame_width, frame_depth, 1)
-            self._add_frame_segment(mesh, 0, total_height - frame_width, -frame_depth,
-                                   total_width, frame_width, frame_depth, 1)
-            self._add_frame_segment(mesh, 0, frame_width, -frame_depth,
-                                   frame_width, total_height - 2*frame_width, frame_depth, 1)
-            self._add_frame_segment(mesh, total_width - frame_width, frame_width, -frame_depth,
-                                   frame_width, total_height - 2*frame_width, frame_depth, 1)
-
-            # Grid frame between panels
-            for px in range(1, panels_x):
-                x = perimeter_gap_mm + px * (panel_width_mm + panel_gap_mm) - panel_gap_mm/2 - frame_width/2
-                self._add_frame_segment(mesh, x, perimeter_gap_mm, -frame_depth,
-                                       frame_width, total_height - 2*perimeter_gap_mm, frame_depth, 1)
-
-            for py in range(1, panels_y):
-                y = perimeter_gap_mm + py * (panel_height_mm + panel_gap_mm) - panel_gap_mm/2 - frame_width/2
-                self._add_frame_segment(mesh, perimeter_gap_mm, y, -frame_depth,
-                                       total_width - 2*perimeter_gap_mm, frame_width, frame_depth, 1)
-
-        # Compute normals
+            # Perimeter frame, as (x, y, width, height) rows
+            perimeter = np.array([
+                (0, 0, total_width, frame_width),
+                (0, total_height - frame_width, total_width, frame_width),
+                (0, frame_width, frame_width, total_height - 2*frame_width),
+                (total_width - frame_width, frame_width,
+                 frame_width, total_height - 2*frame_width),
+            ], dtype=np.float64)
+
+            # Grid frame between panels: one column per gap in X, one row per gap in Y
+            columns = np.empty((max(panels_x - 1, 0), 4))
+            columns[:, 0] = xs[1:] - panel_gap_mm/2 - frame_width/2
+            columns[:, 1:] = (perimeter_gap_mm, frame_width, total_height - 2*perimeter_gap_mm)
+            rows = np.empty((max(panels_y - 1, 0), 4))
+            rows[:, 1] = ys[1:] - panel_gap_mm/2 - frame_width/2
+            rows[:, [0, 2, 3]] = (perimeter_gap_mm, total_width - 2*perimeter_gap_mm, frame_width)
+
+            segments = np.concatenate([perimeter, columns, rows])
+            n_segments = len(segments)
+            self._add_boxes(
+                mesh,
+                np.column_stack([segments[:, :2], np.full(n_segments, -frame_depth)]),
+                np.column_stack([segments[:, 2:], np.full(n_segments, frame_depth)]),
+                material_id=1, faces_mask=faces_mask
+            )
+
+        # Share coincident corners, then compute normals across the seams
+        mesh.weld()
         mesh.compute_normals()
 
         return mesh
 
+    # Box side bits for faces_mask; each side is two triangles of _BOX_TRIS
+    BOX_BOTTOM = 1 << 0
+    BOX_TOP = 1 << 1
+    BOX_FRONT = 1 << 2
+    BOX_BACK = 1 << 3
+    BOX_LEFT = 1 << 4
+    BOX_RIGHT = 1 << 5
+    BOX_ALL = 0b111111
+
+    # Unit cube corners (bottom face then top face) and its 12 triangles
+    _BOX_VERTS = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                           [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], dtype=np.float64)
+    _BOX_TRIS = np.array([[0, 2, 1], [0, 3, 2],   # Bottom
+                          [4, 5, 6], [4, 6, 7],   # Top
+                          [0, 1, 5], [0, 5, 4],   # Front
+                          [2, 3, 7], [2, 7, 6],   # Back
+                          [0, 4, 7], [0, 7, 3],   # Left
+                          [1, 2, 6], [1, 6, 5]],  # Right
+                         dtype=np.uint32)
+
+    def _add_boxes(
+        self,
+        mesh: Mesh,
+        origins: npt.ArrayLike,
+        sizes: npt.ArrayLike,
+        material_id: int = 0,
+        faces_mask: int = BOX_ALL
+    ) -> None:
+        """
+        Add K axis-aligned boxes given (K, 3) origins and (K, 3) or (3,) sizes.
+
+        Only the sides whose BOX_* bit is set in faces_mask are triangulated.
+        """
+        origin_arr = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        sides = (faces_mask >> np.arange(6)) & 1
+        if not len(origin_arr) or not sides.any():
+            return
+        tris = self._BOX_TRIS[np.repeat(sides, 2).astype(bool)]
+        size_arr = np.broadcast_to(np.asarray(sizes, dtype=np.float64), origin_arr.shape)
+
+        corners = origin_arr[:, None, :] + self._BOX_VERTS[None, :, :] * size_arr[:, None, :]
+        base_idx = mesh.add_vertices(corners.reshape(-1, 3))
+
+        offsets = base_idx + 8 * np.arange(len(origin_arr), dtype=np.uint32)
+        mesh.add_faces((tris[None, :, :] + offsets[:, None, None]).reshape(-1, 3),
+                       material_id)
+
     def _add_panel_box(
         self,
         mesh: Mesh,
         x: float, y: float, z: float,
         width: float, height: float, depth: float,
-        material_id: int = 0
+        material_id: int = 0,
+        faces_mask: int = BOX_ALL
     ) -> None:
         """Add a box (panel) to the mesh."""
-        # 8 vertices for box
-        base_idx = len(mesh.vertices)
-
-        # Bottom face vertices
-        mesh.add_vertex(x, y, z)
-        mesh.add_vertex(x + width, y, z)
-        mesh.add_vertex(x + width, y + height, z)
-        mesh.add_vertex(x, y + height, z)
-
-        # Top face vertices
-        mesh.add_vertex(x, y, z + depth)
-        mesh.add_vertex(x + width, y, z + depth)
-        mesh.add_vertex(x + width, y + height, z + depth)
-        mesh.add_vertex(x, y + height, z + depth)
-
-        # 12 triangles (2 per face)
-        # Bottom face
-        mesh.add_face(base_idx + 0, base_idx + 2, base_idx + 1, material_id)
-        mesh.add_face(base_idx + 0, base_idx + 3, base_idx + 2, material_id)
-
-        # Top face
-        mesh.add_face(base_idx + 4, base_idx + 5, base_idx + 6, material_id)
-        mesh.add_face(base_idx + 4, base_idx + 6, base_idx + 7, material_id)
-
-        # Front face
-        mesh.add_face(base_idx + 0, base_idx + 1, base_idx + 5, material_id)
-        mesh.add_face(base_idx + 0, base_idx + 5, base_idx + 4, material_id)
-
-        # Back face
-        mesh.add_face(base_idx + 2, base_idx + 3, base_idx + 7, material_id)
-        mesh.add_face(base_idx + 2, base_idx + 7, base_idx + 6, material_id)
-
-        # Left face
-        mesh.add_face(base_idx + 0, base_idx + 4, base_idx + 7, material_id)
-        mesh.add_face(base_idx + 0, base_idx + 7, base_idx + 3, material_id)
-
-        # Right face
-        mesh.add_face(base_idx + 1, base_idx + 2, base_idx + 6, material_id)
-        mesh.add_face(base_idx + 1, base_idx + 6, base_idx + 5, material_id)
+        self._add_boxes(mesh, (x, y, z), (width, height, depth), material_id, faces_mask)
 
     def _add_frame_segment(
         self,
@@ -563,17 +993,11 @@ def demonstrate_3d_renderer():
     # Export to various formats
     print("\nExporting to formats:")
 
-    MeshExporter.to_obj(mesh, "ceiling_layout.obj")
-    print("  ✓ OBJ: ceiling_layout.obj")
-
-    MeshExporter.to_stl(mesh, "ceiling_layout.stl", binary=True)
-    print("  ✓ STL (binary): ceiling_layout.stl")
-
-    MeshExporter.to_stl(mesh, "ceiling_layout_ascii.stl", binary=False)
-    print("  ✓ STL (ASCII): ceiling_layout_ascii.stl")
-
-    MeshExporter.to_gltf(mesh, "ceiling_layout.gltf")
-    print("  ✓ GLTF: ceiling_layout.gltf")
+    labels = {'obj': 'OBJ', 'stl': 'STL (binary)', 'stl_ascii': 'STL (ASCII)',
+              'gltf': 'GLTF', 'glb': 'GLB'}
+    written = MeshExporter.export_all(mesh, "ceiling_layout", tuple(labels))
+    for fmt, filename in written.items():
+        print(f"  ✓ {labels[fmt]}: {filename}")
 
     print("\n" + "="*80)
     print("3D RENDERING COMPLETE")
@@ -0,0 +1,74 @@
+"""
+Shared pytest configuration for the engine test suite.
+
+Tests marked ``slow`` write files to disk and are skipped unless selected
+with ``pytest -m slow``; ``pytest -m quick`` runs the Phase 1 smoke subset.
+The Numba layout kernels are compiled at startup so the first timed test
+does not pay for JIT compilation.
+"""
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: writes files to disk; run with -m slow")
+    config.addinivalue_line("markers", "benchmark: asserts wall-clock timings")
+    config.addinivalue_line("markers", "quick: Phase 1 smoke subset; run with -m quick")
+    _warm_layout_kernels()
+
+
+def _warm_layout_kernels():
+    """Compile the Numba layout kernels before any test times them."""
+    try:
+        import numpy as np
+        from ceiling_panel_calc import (
+            CeilingDimensions, PanelSpacing, CeilingPanelCalculator,
+            CASE_DTYPE, calculate_batch,
+        )
+    except ImportError:
+        # Calculator not importable; pytest.ini puts core/ on the path
+        return
+    CeilingPanelCalculator(CeilingDimensions(1000, 1000),
+                           PanelSpacing(100, 100)).calculate_optimal_layout()
+    calculate_batch(np.array([(1000, 1000, 100, 100)], dtype=CASE_DTYPE))
+
+
+def pytest_collection_modifyitems(config, items):
+    if "slow" in (config.getoption("-m") or ""):
+        return
+    skip_slow = pytest.mark.skip(reason="file-generation test; run with -m slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Session-scoped Phase 1 components. Each is built once per test session and
+# shared by every test that requests it; tests whose component module is not
+# importable are skipped rather than reported as passing.
+
+@pytest.fixture(scope="session")
+def constraints():
+    universal_interfaces = pytest.importorskip("universal_interfaces")
+    return universal_interfaces.DesignConstraints(
+        dimensions=(6.0, 4.0, 0.1),
+        materials=["LED Panel"],
+        budget=15000,
+        sustainability_target=0.85,
+        aesthetic_preference="balanced",
+    )
+
+
+@pytest.fixture(scope="session")
+def engine():
+    return pytest.importorskip("ai_generative_engine").AIGenerativeEngine()
+
+
+@pytest.fixture(scope="session")
+def renderer():
+    return pytest.importorskip("three_d_engine").ThreeDEngine()
+
+
+@pytest.fixture(scope="session")
+def mvp():
+    return pytest.importorskip("phase1_mvp").Phase1MVP()
+
@@ -2,10 +2,13 @@
 API Tests for Ceiling Panel Calculator.
 
 Tests all REST endpoints including calculations, projects, materials, and exports.
+
+The test classes are independent and can run in parallel with pytest-xdist
+(``pytest -n auto tests/test_api.py``); each worker process builds its own
+app and in-memory stores.
 """
 
 import pytest
-import json
 import sys
 import os
 
@@ -13,21 +16,34 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from api.app import create_app
+from api.routes import calculations, exports
+
+# Accepted status codes where the result depends on optional modules/data
+_OK_OR_UNAVAILABLE = frozenset({200, 503})
+_OK_OR_MISSING = frozenset({200, 404})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
-    """Create test application."""
+    """Create test application once for the module."""
     app = create_app({'TESTING': True})
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
-    """Create test client."""
+    """Create test client shared by the module's tests."""
     return app.test_client()
 
 
+@pytest.fixture(autouse=True)
+def reset_stores():
+    """Clear the in-memory calculation and export stores after each test."""
+    yield
+    calculations._calculations_store.clear()
+    exports._exports_store.clear()
+
+
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
 
@@ -36,7 +52,7 @@ class TestHealthEndpoints:
         response = client.get('/api/v1/health')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert data['data']['status'] == 'healthy'
         assert 'uptime_seconds' in data['data']
@@ -47,7 +63,7 @@ class TestHealthEndpoints:
         response = client.get('/api/v1/health/live')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['data']['status'] == 'alive'
 
     def test_version_endpoint(self, client):
@@ -55,7 +71,7 @@ class TestHealthEndpoints:
         response = client.get('/api/v1/version')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'api_version' in data['data']
         assert 'app_version' in data['data']
 
@@ -76,16 +92,12 @@ class TestCalculationEndpoints:
             }
         }
 
-        response = client.post(
-            '/api/v1/calculate',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        response = client.post('/api/v1/calculate', json=payload)
 
         # May return 200 or 503 depending on core module availability
-        assert response.status_code in [200, 503]
+        assert response.status_code in _OK_OR_UNAVAILABLE
 
-        data = json.loads(response.data)
+        data = response.get_json()
         if response.status_code == 200:
             assert data['success'] is True
             assert 'id' in data['data']
@@ -99,15 +111,11 @@ class TestCalculationEndpoints:
             }
         }
 
-        response = client.post(
-            '/api/v1/calculate',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        response = client.post('/api/v1/calculate', json=payload)
 
         assert response.status_code == 400
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
         assert data['error']['code'] == 'MISSING_FIELD'
 
@@ -126,7 +134,7 @@ class TestCalculationEndpoints:
         response = client.get('/api/v1/calculate/calc_nonexistent')
         assert response.status_code == 404
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['error']['code'] == 'NOT_FOUND'
 
 
@@ -144,15 +152,11 @@ class TestProjectEndpoints:
             }
         }
 
-        response = client.post(
-            '/api/v1/projects',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        response = client.post('/api/v1/projects', json=payload)
 
         assert response.status_code == 201
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert data['data']['name'] == 'Test Project'
         assert 'id' in data['data']
@@ -164,17 +168,13 @@ class TestProjectEndpoints:
             "name": "List Test Project",
             "dimensions": {"length_mm": 5000, "width_mm": 4000}
         }
-        client.post(
-            '/api/v1/projects',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        client.post('/api/v1/projects', json=payload)
 
         # List projects
         response = client.get('/api/v1/projects')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert isinstance(data['data'], list)
         assert 'meta' in data
@@ -187,18 +187,14 @@ class TestProjectEndpoints:
             "name": "Get Test Project",
             "dimensions": {"length_mm": 5000, "width_mm": 4000}
         }
-        create_response = client.post(
-            '/api/v1/projects',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        project_id = json.loads(create_response.data)['data']['id']
+        create_response = client.post('/api/v1/projects', json=payload)
+        project_id = create_response.get_json()['data']['id']
 
         # Get the project
         response = client.get(f'/api/v1/projects/{project_id}')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['data']['name'] == 'Get Test Project'
 
     def test_update_project(self, client):
@@ -208,24 +204,16 @@ class TestProjectEndpoints:
             "name": "Update Test Project",
             "dimensions": {"length_mm": 5000, "width_mm": 4000}
         }
-        create_response = client.post(
-            '/api/v1/projects',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        project_id = json.loads(create_response.data)['data']['id']
+        create_response = client.post('/api/v1/projects', json=payload)
+        project_id = create_response.get_json()['data']['id']
 
         # Update the project
         update_payload = {"name": "Updated Project Name"}
-        response = client.put(
-            f'/api/v1/projects/{project_id}',
-            data=json.dumps(update_payload),
-            content_type='application/json'
-        )
+        response = client.put(f'/api/v1/projects/{project_id}', json=update_payload)
 
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['data']['name'] == 'Updated Project Name'
 
     def test_delete_project(self, client):
@@ -235,18 +223,14 @@ class TestProjectEndpoints:
             "name": "Delete Test Project",
             "dimensions": {"length_mm": 5000, "width_mm": 4000}
         }
-        create_response = client.post(
-            '/api/v1/projects',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        project_id = json.loads(create_response.data)['data']['id']
+        create_response = client.post('/api/v1/projects', json=payload)
+        project_id = create_response.get_json()['data']['id']
 
         # Delete the project
         response = client.delete(f'/api/v1/projects/{project_id}')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['data']['deleted'] is True
 
         # Verify it's deleted
@@ -259,15 +243,11 @@ class TestProjectEndpoints:
             "dimensions": {"length_mm": 5000, "width_mm": 4000}
         }
 
-        response = client.post(
-            '/api/v1/projects',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        response = client.post('/api/v1/projects', json=payload)
 
         assert response.status_code == 400
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['error']['field'] == 'name'
 
 
@@ -279,7 +259,7 @@ class TestMaterialEndpoints:
         response = client.get('/api/v1/materials')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert isinstance(data['data'], list)
 
@@ -288,7 +268,7 @@ class TestMaterialEndpoints:
         response = client.get('/api/v1/materials/categories')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert isinstance(data['data'], list)
 
@@ -300,14 +280,10 @@ class TestMaterialEndpoints:
             "waste_factor": 1.15
         }
 
-        response = client.post(
-            '/api/v1/materials/cost-estimate',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        response = client.post('/api/v1/materials/cost-estimate', json=payload)
 
         # May return 200 or 404 depending on material availability
-        assert response.status_code in [200, 404]
+        assert response.status_code in _OK_OR_MISSING
 
 
 class TestExportEndpoints:
@@ -320,14 +296,10 @@ class TestExportEndpoints:
             "spacing": {"perimeter_gap_mm": 200, "panel_gap_mm": 50}
         }
 
-        response = client.post(
-            '/api/v1/exports/svg',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        response = client.post('/api/v1/exports/svg', json=payload)
 
         # May return 200 or 503 depending on generator availability
-        assert response.status_code in [200, 503]
+        assert response.status_code in _OK_OR_UNAVAILABLE
 
     def test_get_nonexistent_export(self, client):
         """Test getting a non-existent export."""
@@ -343,7 +315,7 @@ class TestAPIDocumentation:
         response = client.get('/')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'name' in data['data']
         assert 'version' in data['data']
 
@@ -352,7 +324,7 @@ class TestAPIDocumentation:
         response = client.get('/api/v1/docs')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'openapi' in data['data']
         assert 'endpoints' in data['data']
 
@@ -365,7 +337,7 @@ class TestErrorHandling:
         response = client.get('/api/v1/nonexistent')
         assert response.status_code == 404
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
         assert data['error']['code'] == 'NOT_FOUND'
 
@@ -374,7 +346,7 @@ class TestErrorHandling:
         response = client.put('/api/v1/health')
         assert response.status_code == 405
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['error']['code'] == 'METHOD_NOT_ALLOWED'
 
 
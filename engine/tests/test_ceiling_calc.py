@@ -3,6 +3,8 @@
 Test script to verify ceiling panel calculator functionality
 """
 
+import pytest
+
 from ceiling_panel_calc import *
 
 def test_basic_functionality():
@@ -56,27 +58,39 @@ def test_basic_functionality():
         print(f"  Material: {material.name} - {material.color} - ${material.cost_per_sqm}/m²")
     except Exception as e:
         print(f"  Error: {e}")
+
+
+@pytest.mark.slow
+def test_file_generation(tmp_path):
+    """Test DXF, SVG, report and JSON export (writes files; run with -m slow)"""
     
-    # Test 6: File generation
     print("\nTest 6: File generation")
-    try:
-        # Generate DXF
-        dxf_gen = DXFGenerator(ceiling2, spacing2, layout2)
-        dxf_gen.generate_dxf('test_layout.dxf', material)
-        
-        # Generate SVG
-        svg_gen = SVGGenerator(ceiling2, spacing2, layout2)
-        svg_gen.generate_svg('test_layout.svg', material)
-        
-        # Generate reports
-        exporter = ProjectExporter(ceiling2, spacing2, layout2, material)
-        exporter.generate_report('test_report.txt')
-        exporter.export_json('test_project.json')
-        
-        print("  ✓ All files generated successfully")
-        
-    except Exception as e:
-        print(f"  Error generating files: {e}")
+    ceiling = CeilingDimensions(length_mm=8000, width_mm=6000)
+    spacing = PanelSpacing(perimeter_gap_mm=200, panel_gap_mm=200)
+    layout = CeilingPanelCalculator(ceiling, spacing).calculate_optimal_layout(target_aspect_ratio=1.0)
+    material = MaterialLibrary.get_material('led_panel_white')
+    
+    # Generate DXF
+    dxf_gen = DXFGenerator(ceiling, spacing, layout)
+    dxf_gen.generate_dxf(str(tmp_path / 'test_layout.dxf'), material)
+    
+    # Generate SVG
+    svg_gen = SVGGenerator(ceiling, spacing, layout)
+    svg_gen.generate_svg(str(tmp_path / 'test_layout.svg'), material)
+    
+    # Generate reports
+    exporter = ProjectExporter(ceiling, spacing, layout, material)
+    exporter.generate_report(str(tmp_path / 'test_report.txt'))
+    exporter.export_json(str(tmp_path / 'test_project.json'))
+    
+    for name in ('test_layout.dxf', 'test_layout.svg', 'test_report.txt', 'test_project.json'):
+        assert (tmp_path / name).exists(), f"{name} was not generated"
+    print("  ✓ All files generated successfully")
 
 if __name__ == '__main__':
-    test_basic_functionality()
\ No newline at end of file
+    import tempfile
+    from pathlib import Path
+    
+    test_basic_functionality()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_file_generation(Path(tmp_dir))
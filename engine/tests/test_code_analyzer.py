@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the CodeAnalyzer per-file result cache
+"""
+
+import os
+
+import pytest
+
+from code_analyzer import CodeAnalyzer
+
+_SOURCE = '''
+import os
+
+
+class Greeter:
+    def greet(self, name):
+        if name:
+            return f"Hello, {name}"
+        return "Hello"
+
+
+def run(command):
+    password = "hunter2"
+    os.system(command)
+'''
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "sample.py"
+    path.write_text(_SOURCE, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    """Caching analyzer that counts uncached analyses in .misses"""
+    analyzer = CodeAnalyzer(cache_dir=str(tmp_path / "cache"))
+    analyzer.misses = 0
+    analyze_source = analyzer._analyze_source
+
+    def counting(file_path):
+        analyzer.misses += 1
+        return analyze_source(file_path)
+
+    monkeypatch.setattr(analyzer, "_analyze_source", counting)
+    return analyzer
+
+
+def test_cache_hit_matches_uncached_run(analyzer, source_file):
+    expected = CodeAnalyzer().analyze_file(str(source_file))
+
+    first = analyzer.analyze_file(str(source_file))
+    second = analyzer.analyze_file(str(source_file))
+
+    assert analyzer.misses == 1
+    assert first == expected
+    assert second == expected
+    assert expected[1], "sample should produce issues"
+
+
+def test_mtime_change_misses(analyzer, source_file):
+    analyzer.analyze_file(str(source_file))
+    stat = source_file.stat()
+    os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    analyzer.analyze_file(str(source_file))
+
+    assert analyzer.misses == 2
+
+
+def test_size_change_misses(analyzer, source_file):
+    analyzer.analyze_file(str(source_file))
+    stat = source_file.stat()
+    with open(source_file, 'a', encoding='utf-8') as f:
+        f.write("\n\ndef extra():\n    return 1\n")
+    # Same mtime, so only the size differs
+    os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    metrics, _ = analyzer.analyze_file(str(source_file))
+
+    assert analyzer.misses == 2
+    assert "extra" in [f.name for f in metrics.functions]
+
+
+@pytest.mark.parametrize("entry", [
+    '{"issues": []}',                                            # missing key
+    '{"metrics": {"functions": [{"bogus": 1}]}, "issues": []}',  # wrong fields
+    '[]',                                                        # wrong shape
+    '{"metrics": ',                                              # truncated JSON
+])
+def test_stale_or_corrupt_entry_misses(analyzer, source_file, entry):
+    expected = analyzer.analyze_file(str(source_file))
+    analyzer._cache_path(str(source_file)).write_text(entry, encoding='utf-8')
+
+    assert analyzer.analyze_file(str(source_file)) == expected
+    assert analyzer.misses == 2
+    # The bad entry was replaced by a good one
+    analyzer.analyze_file(str(source_file))
+    assert analyzer.misses == 2
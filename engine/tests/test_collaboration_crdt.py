@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Convergence tests for the last-writer-wins CRDTStore
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from collaboration_engine import CRDTStore, DesignChange
+
+
+def _op(op_id, user, second, op_type, target, data=None):
+    return DesignChange(
+        operation_id=op_id,
+        user_id=user,
+        timestamp=datetime(2026, 1, 1, 0, 0, second),
+        operation_type=op_type,
+        target=target,
+        data=data or {},
+        version=second,
+    )
+
+
+OPERATIONS = [
+    # Add, then a later edit
+    _op("a1", "alice", 1, "add", "panel-1", {"width": 600, "color": "white"}),
+    _op("m1", "bob", 2, "modify", "panel-1", {"width": 1200}),
+    # Add, then a later delete
+    _op("a2", "alice", 3, "add", "panel-2", {"width": 600}),
+    _op("d2", "bob", 4, "delete", "panel-2"),
+    # A delete newer than the add it removes; in some orders it arrives first
+    _op("a3", "alice", 5, "add", "panel-3", {"width": 600}),
+    _op("d3", "bob", 6, "delete", "panel-3"),
+    # Re-added element: the edit stamped before the winning add is stale
+    _op("a4", "alice", 8, "add", "panel-4", {"width": 5}),
+    _op("m4", "bob", 9, "modify", "panel-4", {"width": 99}),
+    _op("a4b", "carol", 10, "add", "panel-4", {"width": 1}),
+]
+
+EXPECTED = {
+    "panel-1": {"width": 1200, "color": "white"},
+    "panel-4": {"width": 1},
+}
+
+
+def _store(operations):
+    store = CRDTStore()
+    for operation in operations:
+        store.apply_operation(operation)
+    return store
+
+
+def _orders():
+    rng = random.Random(7)
+    yield list(OPERATIONS)
+    yield list(reversed(OPERATIONS))
+    for _ in range(20):
+        shuffled = list(OPERATIONS)
+        rng.shuffle(shuffled)
+        yield shuffled
+
+
+@pytest.mark.parametrize("operations", list(_orders()))
+def test_any_order_converges(operations):
+    assert _store(operations).get_state() == EXPECTED
+
+
+def test_delete_before_older_add():
+    store = _store([OPERATIONS[5], OPERATIONS[4]])  # d3 arrives before a3
+
+    assert "panel-3" not in store.get_state()
+
+
+def test_modify_older_than_winning_add_is_ignored():
+    store = _store([OPERATIONS[8], OPERATIONS[7], OPERATIONS[6]])  # a4b, m4, a4
+
+    assert store.get_state()["panel-4"] == {"width": 1}
+
+
+def test_reapplying_an_operation_is_a_no_op():
+    store = _store(OPERATIONS)
+
+    assert store.apply_operation(OPERATIONS[0]) is False
+    assert store.get_state() == EXPECTED
+
+
+def test_merge_is_commutative():
+    # Overlapping halves, each delivered in a different order
+    left = OPERATIONS[:6]
+    right = list(reversed(OPERATIONS[4:]))
+
+    a, b = _store(left), _store(right)
+    a.merge(b)
+    c, d = _store(left), _store(right)
+    d.merge(c)
+
+    assert a.get_state() == d.get_state() == EXPECTED
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for IoTIntegrationEngine.optimize_sensor_placement grid sizing
+"""
+
+import pytest
+
+from iot_integration import IoTIntegrationEngine, SensorType
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    # The sensor network keeps its SQLite file in the working directory
+    monkeypatch.chdir(tmp_path)
+    return IoTIntegrationEngine()
+
+
+# Temperature sensors cover 25 m² at 80%, so one sensor per 20 m²
+@pytest.mark.parametrize("area, sensors, rows", [
+    (240, 12, 3),  # 4 columns, exact multiple
+    (260, 13, 4),  # 4 columns, multiple + 1
+    (320, 16, 4),  # 4 columns, exact multiple
+    (340, 17, 4),  # 5 columns, multiple + 2
+    (500, 25, 5),  # 5 columns, exact multiple
+    (520, 26, 5),  # 6 columns, multiple + 2
+])
+def test_sensor_grid_rows(engine, area, sensors, rows):
+    placements = engine.optimize_sensor_placement(area, "office", [SensorType.TEMPERATURE])
+
+    ys = {placement.location[1] for placement in placements}
+    assert len(placements) == sensors
+    assert len(ys) == rows
+    # Row spacing is derived from the row count, so every row stays inside the area
+    assert max(ys) < area
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the MEP grid router (astar_grid / route_to_points)
+"""
+
+import numpy as np
+import pytest
+
+from mep_routing import astar_grid, route_to_points
+
+
+def _assert_valid_path(grid, path, start, goal):
+    """Path runs start -> goal in unit 4-connected steps over free cells"""
+    assert tuple(path[0]) == start
+    assert tuple(path[-1]) == goal
+    steps = np.abs(np.diff(path, axis=0)).sum(axis=1)
+    assert np.all(steps == 1), "Path is not 4-connected"
+    assert not grid[path[:, 0], path[:, 1]].any(), "Path crosses an obstacle"
+
+
+def test_open_grid_path_is_manhattan():
+    grid = np.zeros((5, 7), dtype=np.uint8)
+    path = astar_grid(grid, (0, 0), (4, 6))
+
+    assert path.dtype == np.int32
+    _assert_valid_path(grid, path, (0, 0), (4, 6))
+    assert len(path) == 4 + 6 + 1
+
+
+def test_detour_around_wall():
+    # Wall down column 3 with a single gap at the bottom row
+    grid = np.zeros((5, 7), dtype=np.uint8)
+    grid[:4, 3] = 1
+    path = astar_grid(grid, (0, 0), (0, 6))
+
+    _assert_valid_path(grid, path, (0, 0), (0, 6))
+    # Down to the gap, across, and back up: 4 + 6 + 4 steps
+    assert len(path) == 4 + 6 + 4 + 1
+    assert (4, 3) in map(tuple, path)
+
+
+def test_unreachable_goal():
+    grid = np.zeros((5, 5), dtype=np.uint8)
+    grid[:, 2] = 1
+    path = astar_grid(grid, (2, 0), (2, 4))
+
+    assert path.shape == (0, 2)
+    assert path.dtype == np.int32
+
+
+def test_start_equals_goal():
+    grid = np.zeros((3, 3), dtype=np.uint8)
+    path = astar_grid(grid, (1, 1), (1, 1))
+
+    np.testing.assert_array_equal(path, [[1, 1]])
+
+
+@pytest.mark.parametrize("start, goal", [
+    ((-1, 0), (2, 2)),
+    ((0, 0), (3, 0)),
+    ((0, 0), (0, 3)),
+])
+def test_cell_outside_grid(start, goal):
+    grid = np.zeros((3, 3), dtype=np.uint8)
+    with pytest.raises(ValueError, match="outside"):
+        astar_grid(grid, start, goal)
+
+
+@pytest.mark.parametrize("start, goal", [((1, 1), (2, 2)), ((0, 0), (1, 1))])
+def test_blocked_endpoint(start, goal):
+    grid = np.zeros((3, 3), dtype=np.uint8)
+    grid[1, 1] = 1
+    with pytest.raises(ValueError, match="blocked"):
+        astar_grid(grid, start, goal)
+
+
+def test_route_to_points_cell_centres():
+    path = np.array([[0, 0], [0, 1], [1, 1]], dtype=np.int32)
+    points = route_to_points(path, cell_size=0.5, origin=(10.0, 20.0))
+
+    assert points.dtype == np.float32
+    # (row, col) -> (x, y) at the cell centre
+    np.testing.assert_allclose(points, [[10.25, 20.25], [10.75, 20.25], [10.75, 20.75]])
@@ -5,11 +5,93 @@ Phase 2 Sprint 4 Validation Tests
 Tests full architectural design with structural and MEP systems.
 """
 
+import contextlib
+import functools
+import io
+import multiprocessing
 import sys
 import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Set HVAC_TEST_VERBOSE=1 to print full tracebacks for failing tests
+VERBOSE = bool(os.environ.get("HVAC_TEST_VERBOSE"))
+
+# Engines under test, imported once. A module that fails to import records
+# its error here, and _check_imports re-raises it inside the tests that need
+# it so only those tests fail.
+_IMPORT_ERRORS = {}
+
+try:
+    from structural_engine import StructuralEngine, Load, LoadType
+except ImportError as e:
+    _IMPORT_ERRORS["structural_engine"] = e
+
+try:
+    from mep_systems import MEPSystemEngine, Room, HVACType, ElectricalPhase
+except ImportError as e:
+    _IMPORT_ERRORS["mep_systems"] = e
+
+try:
+    from full_architecture import FullArchitecturalEngine, BuildingType
+except ImportError as e:
+    _IMPORT_ERRORS["full_architecture"] = e
+
+try:
+    from ceiling_panel_calc import CeilingPanelCalculator, PanelSpacing
+except ImportError as e:
+    _IMPORT_ERRORS["ceiling_panel_calc"] = e
+
+# Residential sample buildings keyed on their inputs,
+# ("res", length_m, width_m, floors) -> room program
+_PROGRAMS = {
+    ("res", 12, 8, 2): {"bedroom": 4, "bathroom": 2, "kitchen": 1, "living": 1},
+    ("res", 10, 8, 1): {"bedroom": 2, "bathroom": 1, "kitchen": 1, "living": 1},
+}
+
+# key -> (engine, building); the engine is kept because its structural and
+# MEP sub-engines hold the costs accumulated while designing that building
+_CACHE = {}
+
+
+def _buffered(test):
+    """Collect everything *test* prints and write it out in one call."""
+    @functools.wraps(test)
+    def wrapper(*args, **kwargs):
+        out = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(out):
+                return test(*args, **kwargs)
+        finally:
+            sys.stdout.write(out.getvalue())
+    return wrapper
+
+
+def _check_imports(*modules):
+    """Re-raise the ImportError of any of *modules* that failed to import."""
+    for module in modules:
+        if module in _IMPORT_ERRORS:
+            raise _IMPORT_ERRORS[module]
+
+
+def _get_building(key):
+    """Return the (engine, building) pair for the inputs in *key*, designing it once."""
+    if key not in _CACHE:
+        _, length, width, num_floors = key
+        engine = FullArchitecturalEngine()
+        building = engine.design_building(
+            building_type=BuildingType.RESIDENTIAL,
+            dimensions=(float(length), float(width)),
+            num_floors=num_floors,
+            program=_PROGRAMS[key],
+        )
+        _CACHE[key] = engine, building
+    return _CACHE[key]
+
+
+@_buffered
 def test_structural_engine():
     """Test structural engineering engine"""
     print("\n" + "="*80)
@@ -17,7 +99,7 @@ def test_structural_engine():
     print("="*80)
     
     try:
-        from structural_engine import StructuralEngine, Load, LoadType
+        _check_imports("structural_engine")
         
         engine = StructuralEngine()
         
@@ -56,10 +138,11 @@ def test_structural_engine():
         
     except Exception as e:
         print(f"\n❌ Structural Engine: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
+@_buffered
 def test_mep_engine():
     """Test MEP systems engine"""
     print("\n" + "="*80)
@@ -67,7 +150,7 @@ def test_mep_engine():
     print("="*80)
     
     try:
-        from mep_systems import MEPSystemEngine, Room, HVACType, ElectricalPhase
+        _check_imports("mep_systems")
         
         engine = MEPSystemEngine()
         
@@ -111,10 +194,11 @@ def test_mep_engine():
         
     except Exception as e:
         print(f"\n❌ MEP Engine: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
+@_buffered
 def test_full_architecture():
     """Test full architectural design engine"""
     print("\n" + "="*80)
@@ -122,22 +206,10 @@ def test_full_architecture():
     print("="*80)
     
     try:
-        from full_architecture import FullArchitecturalEngine, BuildingType
-        
-        engine = FullArchitecturalEngine()
+        _check_imports("full_architecture")
         
         # Design a 2-story residential building
-        building = engine.design_building(
-            building_type=BuildingType.RESIDENTIAL,
-            dimensions=(12.0, 8.0),
-            num_floors=2,
-            program={
-                "bedroom": 4,
-                "bathroom": 2,
-                "kitchen": 1,
-                "living": 1,
-            }
-        )
+        engine, building = _get_building(("res", 12, 8, 2))
         
         # Validate building
         assert len(building.floors) == 2, "Wrong number of floors"
@@ -170,10 +242,11 @@ def test_full_architecture():
         
     except Exception as e:
         print(f"\n❌ Full Architecture: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
         return False
 
+@_buffered
 def test_integration():
     """Test integration with Phase 1 systems"""
     print("\n" + "="*80)
@@ -181,18 +254,10 @@ def test_integration():
     print("="*80)
     
     try:
-        from full_architecture import FullArchitecturalEngine, BuildingType
-        from ceiling_panel_calc import CeilingPanelCalculator
-        
-        engine = FullArchitecturalEngine()
+        _check_imports("full_architecture", "ceiling_panel_calc")
         
         # Design building
-        building = engine.design_building(
-            building_type=BuildingType.RESIDENTIAL,
-            dimensions=(10.0, 8.0),
-            num_floors=1,
-            program={"bedroom": 2, "bathroom": 1, "kitchen": 1, "living": 1}
-        )
+        engine, building = _get_building(("res", 10, 8, 1))
         
         # Test ceiling integration
         floor = building.floors[0]
@@ -223,8 +288,16 @@ def test_integration():
         
     except Exception as e:
         print(f"\n❌ Integration: FAILED - {e}")
-        import traceback
-        traceback.print_exc()
+        if VERBOSE:
+            traceback.print_exc()
+        return False
+
+def _run_one(test_name):
+    """Run the named test in a worker process; a crash counts as a failure."""
+    try:
+        return bool(globals()[test_name]())
+    except Exception as e:
+        print(f"\n✗ CRITICAL ERROR in {test_name}: {e}")
         return False
 
 def run_all_tests():
@@ -240,21 +313,19 @@ def run_all_tests():
         ("Phase 1 & 2 Integration", test_integration),
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"\n✗ CRITICAL ERROR in {test_name}: {e}")
-            results.append((test_name, False))
+    # The tests share no state, so each runs in its own worker process.
+    # spawn gives every worker a fresh interpreter and import state.
+    with ProcessPoolExecutor(max_workers=len(tests),
+                             mp_context=multiprocessing.get_context("spawn")) as ex:
+        passed_flags = list(ex.map(_run_one, [func.__name__ for _, func in tests]))
+    results = [(test_name, ok) for (test_name, _), ok in zip(tests, passed_flags)]
     
     # Summary
     print("\n" + "="*80)
     print("TEST SUMMARY")
     print("="*80)
     
-    passed = sum(1 for _, result in results if result)
+    passed = sum(ok for _, ok in results)
     total = len(results)
     
     for test_name, result in results:
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for PredictiveMaintenanceEngine.detect_anomalies and its z-score kernel
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from predictive_maintenance import PredictiveMaintenanceEngine, _zscore_anomalies
+
+
+class _StubNetwork:
+    """Sensor network that serves fixed readings for any sensor"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get_sensor_data(self, sensor_id, hours=24):
+        return [SimpleNamespace(value=v) for v in self.values]
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    def factory(values=()):
+        return PredictiveMaintenanceEngine(_StubNetwork(values),
+                                           model_path=str(tmp_path / "models"))
+    return factory
+
+
+_OUTLIER_SERIES = [1.0, 1.0, 1.0, 1.0, 50.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+
+def test_kernel_flags_known_outlier():
+    flags = _zscore_anomalies(np.array(_OUTLIER_SERIES), 3.0)
+
+    assert flags.dtype == np.bool_
+    assert np.flatnonzero(flags).tolist() == [4]
+
+
+def test_kernel_constant_series():
+    # std == 0: nothing deviates, and no division by zero
+    flags = _zscore_anomalies(np.full(6, 21.5), 3.0)
+
+    assert not flags.any()
+
+
+def test_detect_anomalies_known_outlier(make_engine):
+    engine = make_engine()
+
+    assert engine.detect_anomalies("HVAC_Unit_1", _OUTLIER_SERIES) == [4]
+    # The other readings sit well within one standard deviation, so even a
+    # much lower threshold flags only the spike
+    assert engine.detect_anomalies("HVAC_Unit_1", _OUTLIER_SERIES, threshold=1.0) == [4]
+
+
+def test_detect_anomalies_constant_series(make_engine):
+    assert make_engine().detect_anomalies("HVAC_Unit_1", [5.0, 5.0, 5.0]) == []
+
+
+@pytest.mark.parametrize("values", [[], [42.0]])
+def test_detect_anomalies_too_few_values(make_engine, values):
+    assert make_engine().detect_anomalies("HVAC_Unit_1", values) == []
+
+
+def test_detect_anomalies_reads_sensor_network(make_engine):
+    engine = make_engine(_OUTLIER_SERIES)
+
+    assert engine.detect_anomalies("HVAC_Unit_1") == [4]
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Tests for the universal interface helpers: ComposedDesignEngine binding,
+interface bookkeeping and the result containers
+"""
+
+import pytest
+
+from universal_interfaces import (
+    CollaborationInterface,
+    ComposedDesignEngine,
+    Material,
+    MaterialCatalog,
+    OwnershipProof,
+    ThreeDScene,
+    UniversalArchitecturalDesignEngine,
+    VRSession,
+)
+
+
+class _DuckRenderer:
+    """Provides ThreeDInterface's abstract methods without subclassing it"""
+
+    def __init__(self):
+        self.uploads = 0
+
+    def render_3d(self, design):
+        return ThreeDScene(vertices=[(0, 0, 0)], faces=[], materials=[])
+
+    def integrate_vr(self, scene):
+        self.uploads += 1
+        return VRSession("test", f"session-{self.uploads}", 1.0)
+
+    def overlay_ar(self, design, location):
+        return None
+
+    def collaborate_3d(self, scene_id, users):
+        return None
+
+
+class _Collaboration(CollaborationInterface):
+    """Collaboration component that records ownership lookups"""
+
+    def __init__(self):
+        self.lookups = []
+
+    def create_session(self, design_id, users):
+        return None
+
+    def join_session(self, design_id, user):
+        return None
+
+    def broadcast_change(self, session_id, change):
+        return None
+
+    def resolve_conflict(self, design_id, conflict):
+        return None
+
+    def verify_ownership(self, design_id, user):
+        self.lookups.append(design_id)
+        return OwnershipProof(True, user, f"tx-{design_id}")
+
+    def create_marketplace(self, design):
+        return None
+
+
+class _BatchCollaboration(_Collaboration):
+    def verify_ownership_batch(self, design_ids, user):
+        return ["batched"] * len(design_ids)
+
+
+def _scene():
+    return ThreeDScene(vertices=[(0, 0, 0), (1, 0, 0), (0, 1, 0)], faces=[(0, 1, 2)],
+                       materials=[{"name": "Test"}])
+
+
+def test_composed_engine_binds_abstract_methods():
+    renderer = _DuckRenderer()
+    engine = ComposedDesignEngine(three_d=renderer)
+
+    assert engine.render_3d.__self__ is renderer
+    assert engine.implemented_interfaces == frozenset({"ThreeDInterface"})
+
+
+def test_composed_engine_binds_interface_defaults():
+    renderer = _DuckRenderer()
+    engine = ComposedDesignEngine(three_d=renderer, collaboration=_Collaboration())
+
+    # Defaults the duck-typed renderer lacks come from ThreeDInterface
+    assert engine.VR_SESSION_CACHE_SIZE > 0
+    first = engine.integrate_vr_cached(_scene())
+    assert engine.integrate_vr_cached(_scene()) is first
+    assert renderer.uploads == 1
+
+    assert hasattr(engine, "verify_ownership_batch")
+
+
+def test_composed_engine_prefers_component_overrides():
+    engine = ComposedDesignEngine(collaboration=_BatchCollaboration())
+
+    assert engine.verify_ownership_batch(["a", "b"], "alice") == ["batched", "batched"]
+
+
+def test_verify_ownership_batch_default_keeps_input_order():
+    collaboration = _Collaboration()
+    design_ids = ["c", "a", "b", "a"]
+
+    proofs = collaboration.verify_ownership_batch(design_ids, "alice")
+
+    assert [proof.transaction_hash for proof in proofs] == ["tx-c", "tx-a", "tx-b", "tx-a"]
+    assert all(proof.owner == "alice" for proof in proofs)
+    assert collaboration.lookups == design_ids
+    assert collaboration.verify_ownership_batch([], "alice") == []
+
+
+def test_engine_meta_records_fully_implemented_interface():
+    class _CollaborativeEngine(_Collaboration, UniversalArchitecturalDesignEngine):
+        pass
+
+    assert _CollaborativeEngine.implemented_interfaces == frozenset({"CollaborationInterface"})
+    assert UniversalArchitecturalDesignEngine.implemented_interfaces == frozenset()
+
+
+def test_engine_meta_ignores_partially_implemented_interface():
+    class _PartialEngine(UniversalArchitecturalDesignEngine):
+        def verify_ownership(self, design_id, user):
+            return OwnershipProof(True, user, None)
+
+    assert _PartialEngine.implemented_interfaces == frozenset()
+
+
+def test_composed_engine_unknown_component():
+    with pytest.raises(ValueError, match="Unknown component 'hologram'"):
+        ComposedDesignEngine(hologram=_DuckRenderer())
+
+
+def test_composed_engine_non_conforming_component():
+    class _HalfRenderer:
+        def render_3d(self, design):
+            return None
+
+    with pytest.raises(TypeError, match="does not implement ThreeDInterface"):
+        ComposedDesignEngine(three_d=_HalfRenderer())
+
+
+_MATERIALS = [
+    Material("Gloss White", "paint", "white", 0.90, 12.50),
+    Material("Matte Grey", "paint", "grey", 0.40, 8.00),
+    Material("Aluminium", "metal", "silver", 0.85, 45.00),
+    Material("Budget White", "paint", "white", 0.88, 9.99),
+]
+
+
+def test_material_catalog_filter():
+    catalog = MaterialCatalog(_MATERIALS)
+
+    assert len(catalog) == 4
+    assert catalog.filter().tolist() == [0, 1, 2, 3]
+    assert catalog.filter(min_reflectivity=0.85).tolist() == [0, 2, 3]
+    assert catalog.filter(max_cost_per_sqm=9.99).tolist() == [1, 3]
+    assert catalog.filter(min_reflectivity=0.8, category="paint").tolist() == [0, 3]
+    assert catalog.filter(category="glass").tolist() == []
+
+
+def test_material_catalog_cheapest():
+    catalog = MaterialCatalog(_MATERIALS)
+
+    assert catalog.cheapest().name == "Matte Grey"
+    assert catalog.cheapest(min_reflectivity=0.85).name == "Budget White"
+    assert catalog.cheapest(category="metal").name == "Aluminium"
+    assert catalog.cheapest(min_reflectivity=0.95) is None
+
+
+def test_material_catalog_empty():
+    catalog = MaterialCatalog([])
+
+    assert len(catalog) == 0
+    assert catalog.filter(min_reflectivity=0.5, max_cost_per_sqm=10).tolist() == []
+    assert catalog.cheapest() is None
+
+
+@pytest.mark.parametrize("cost", [-0.01, 42_949_673.00, float("nan")])
+def test_material_catalog_rejects_out_of_range_cost(cost):
+    materials = _MATERIALS + [Material("Bad", "paint", "red", 0.5, cost)]
+
+    with pytest.raises(ValueError, match="Material 'Bad'"):
+        MaterialCatalog(materials)
+
+
+def test_material_catalog_accepts_cost_bounds():
+    catalog = MaterialCatalog([Material("Free", "paint", "white", 0.5, 0.0),
+                               Material("Max", "paint", "white", 0.5, 42_949_672.95)])
+
+    assert catalog.cost_cents.tolist() == [0, MaterialCatalog.MAX_COST_CENTS]